@@ -2,97 +2,224 @@
 Generate PDF versions of TCP contracts with different layouts
 """
 
+import io
+import re
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY, TA_RIGHT
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
 from reportlab.lib import colors
+from reportlab import rl_config
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Skip ReportLab's per-attribute validation on every flowable/style we create
+rl_config.shapeChecking = 0
+
+# Section headers: ALL CAPS lines ending with a colon (ASCII equivalent of
+# line.isupper() and line.endswith(':'))
+_HEADER_RE = re.compile(r'^[^a-z]*[A-Z][^a-z]*:$')
+
+# Document title line, rendered with the layout's title style
+_TITLE_TRIGGER = "TIME CHARTER PARTY"
+
+# Single-pass XML escaping for Paragraph markup
+_XML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+
+def _escape_xml(line):
+    """Escape &, < and > for Paragraph markup, skipping lines that have none."""
+    if '&' in line or '<' in line or '>' in line:
+        return line.translate(_XML_ESCAPE)
+    return line
+
+
+# Build the sample style sheet once; it is expensive and identical for every PDF
+_STYLES = getSampleStyleSheet()
+
+# Layout 1 (bulk carrier) styles
+_BULK_TITLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontName='Times-Bold',
+    fontSize=16,
+    alignment=TA_CENTER,
+    spaceAfter=30,
+    spaceBefore=20
+)
+
+_BULK_HEADING = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontName='Times-Bold',
+    fontSize=12,
+    spaceAfter=10,
+    spaceBefore=15,
+    textColor=colors.black
+)
+
+_BULK_BODY = ParagraphStyle(
+    'CustomBody',
+    parent=_STYLES['BodyText'],
+    fontName='Times-Roman',
+    fontSize=10,
+    alignment=TA_JUSTIFY,
+    spaceAfter=6,
+    leading=14
+)
+
+# Layout 2 (tanker) styles
+_TANKER_TITLE = ParagraphStyle(
+    'ModernTitle',
+    parent=_STYLES['Heading1'],
+    fontName='Helvetica-Bold',
+    fontSize=18,
+    alignment=TA_LEFT,
+    spaceAfter=20,
+    spaceBefore=10,
+    textColor=colors.HexColor('#1a5490')
+)
+
+_TANKER_HEADING = ParagraphStyle(
+    'ModernHeading',
+    parent=_STYLES['Heading2'],
+    fontName='Helvetica-Bold',
+    fontSize=11,
+    spaceAfter=8,
+    spaceBefore=12,
+    textColor=colors.HexColor('#2e75b6'),
+    borderPadding=5,
+    backColor=colors.HexColor('#e8f2f9')
+)
+
+_TANKER_BODY = ParagraphStyle(
+    'ModernBody',
+    parent=_STYLES['BodyText'],
+    fontName='Helvetica',
+    fontSize=9,
+    alignment=TA_LEFT,
+    spaceAfter=5,
+    leading=13
+)
+
+# Layout 3 (container) styles
+_CONTAINER_TITLE = ParagraphStyle(
+    'CompactTitle',
+    parent=_STYLES['Heading1'],
+    fontName='Courier-Bold',
+    fontSize=14,
+    alignment=TA_CENTER,
+    spaceAfter=15,
+    spaceBefore=10
+)
+
+_CONTAINER_HEADING = ParagraphStyle(
+    'CompactHeading',
+    parent=_STYLES['Heading2'],
+    fontName='Courier-Bold',
+    fontSize=10,
+    spaceAfter=6,
+    spaceBefore=10,
+    textColor=colors.black,
+    backColor=colors.HexColor('#d9d9d9'),
+    borderPadding=3
+)
+
+_CONTAINER_BODY = ParagraphStyle(
+    'CompactBody',
+    parent=_STYLES['BodyText'],
+    fontName='Courier',
+    fontSize=8,
+    alignment=TA_LEFT,
+    spaceAfter=3,
+    leading=10
+)
 
 
 def read_contract(file_path):
     """Read contract text file and return content."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    return Path(file_path).read_text(encoding='utf-8')
 
 
-def generate_bulk_carrier_pdf(text_content, output_path):
+def _render_pdf(text_content, output_path, *, pagesize, margins, title_style,
+                heading_style, body_style, spacer_height, title_spacer=0):
     """
-    Layout 1: Traditional formal layout
-    - Letter size
-    - Times Roman font
-    - Justified text
-    - Wide margins
-    - Section headers in bold
+    Lay out contract text with one set of styles (shared by all three layouts).
+
+    Args:
+        margins: (left, right, top, bottom) page margins
+        spacer_height: Vertical space per blank line
+        title_spacer: Extra space after the title, if any
     """
+    left, right, top, bottom = margins
     doc = SimpleDocTemplate(
         output_path,
-        pagesize=letter,
-        leftMargin=1.25*inch,
-        rightMargin=1.25*inch,
-        topMargin=1*inch,
-        bottomMargin=1*inch
-    )
-
-    styles = getSampleStyleSheet()
-
-    # Custom styles for this layout
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontName='Times-Bold',
-        fontSize=16,
-        alignment=TA_CENTER,
-        spaceAfter=30,
-        spaceBefore=20
-    )
-
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontName='Times-Bold',
-        fontSize=12,
-        spaceAfter=10,
-        spaceBefore=15,
-        textColor=colors.black
-    )
-
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['BodyText'],
-        fontName='Times-Roman',
-        fontSize=10,
-        alignment=TA_JUSTIFY,
-        spaceAfter=6,
-        leading=14
+        pagesize=pagesize,
+        leftMargin=left,
+        rightMargin=right,
+        topMargin=top,
+        bottomMargin=bottom
     )
 
     story = []
-    lines = text_content.split('\n')
 
-    for line in lines:
+    # Stream lines rather than building the whole split list first
+    blank_run = 0
+    for line in io.StringIO(text_content):
         line = line.strip()
         if not line:
-            story.append(Spacer(1, 0.15*inch))
+            blank_run += 1
             continue
 
+        # One Spacer for a run of blank lines
+        if blank_run:
+            story.append(Spacer(1, blank_run * spacer_height))
+            blank_run = 0
+
         # Title
-        if line == "TIME CHARTER PARTY":
+        if line == _TITLE_TRIGGER:
             story.append(Paragraph(line, title_style))
+            if title_spacer:
+                story.append(Spacer(1, title_spacer))
         # Main section headers (ALL CAPS with colons)
-        elif line.isupper() and line.endswith(':'):
+        elif _HEADER_RE.match(line):
+            line = _escape_xml(line)
             story.append(Paragraph(line, heading_style))
         # Regular text
         else:
             # Escape special characters for XML
-            line = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+            line = _escape_xml(line)
             story.append(Paragraph(line, body_style))
 
+    if blank_run:
+        story.append(Spacer(1, blank_run * spacer_height))
+
     doc.build(story)
     print(f"Generated: {output_path}")
 
 
+def generate_bulk_carrier_pdf(text_content, output_path):
+    """
+    Layout 1: Traditional formal layout
+    - Letter size
+    - Times Roman font
+    - Justified text
+    - Wide margins
+    - Section headers in bold
+    """
+    _render_pdf(
+        text_content,
+        output_path,
+        pagesize=letter,
+        margins=(1.25*inch, 1.25*inch, 1*inch, 1*inch),
+        title_style=_BULK_TITLE,
+        heading_style=_BULK_HEADING,
+        body_style=_BULK_BODY,
+        spacer_height=0.15*inch
+    )
+
+
 def generate_tanker_pdf(text_content, output_path):
     """
     Layout 2: Modern business layout
@@ -103,76 +230,18 @@ def generate_tanker_pdf(text_content, output_path):
     - Blue section headers
     - Two-column layout for some sections
     """
-    doc = SimpleDocTemplate(
+    _render_pdf(
+        text_content,
         output_path,
         pagesize=A4,
-        leftMargin=0.8*inch,
-        rightMargin=0.8*inch,
-        topMargin=0.9*inch,
-        bottomMargin=0.9*inch
+        margins=(0.8*inch, 0.8*inch, 0.9*inch, 0.9*inch),
+        title_style=_TANKER_TITLE,
+        heading_style=_TANKER_HEADING,
+        body_style=_TANKER_BODY,
+        spacer_height=0.1*inch,
+        title_spacer=0.2*inch
     )
 
-    styles = getSampleStyleSheet()
-
-    # Custom styles for modern look
-    title_style = ParagraphStyle(
-        'ModernTitle',
-        parent=styles['Heading1'],
-        fontName='Helvetica-Bold',
-        fontSize=18,
-        alignment=TA_LEFT,
-        spaceAfter=20,
-        spaceBefore=10,
-        textColor=colors.HexColor('#1a5490')
-    )
-
-    heading_style = ParagraphStyle(
-        'ModernHeading',
-        parent=styles['Heading2'],
-        fontName='Helvetica-Bold',
-        fontSize=11,
-        spaceAfter=8,
-        spaceBefore=12,
-        textColor=colors.HexColor('#2e75b6'),
-        borderPadding=5,
-        backColor=colors.HexColor('#e8f2f9')
-    )
-
-    body_style = ParagraphStyle(
-        'ModernBody',
-        parent=styles['BodyText'],
-        fontName='Helvetica',
-        fontSize=9,
-        alignment=TA_LEFT,
-        spaceAfter=5,
-        leading=13
-    )
-
-    story = []
-    lines = text_content.split('\n')
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            story.append(Spacer(1, 0.1*inch))
-            continue
-
-        # Title
-        if line == "TIME CHARTER PARTY":
-            story.append(Paragraph(line, title_style))
-            story.append(Spacer(1, 0.2*inch))
-        # Main section headers
-        elif line.isupper() and line.endswith(':'):
-            line = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            story.append(Paragraph(line, heading_style))
-        # Regular text
-        else:
-            line = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            story.append(Paragraph(line, body_style))
-
-    doc.build(story)
-    print(f"Generated: {output_path}")
-
 
 def generate_container_pdf(text_content, output_path):
     """
@@ -184,93 +253,57 @@ def generate_container_pdf(text_content, output_path):
     - Gray shaded headers
     - Dense layout
     """
-    doc = SimpleDocTemplate(
+    _render_pdf(
+        text_content,
         output_path,
         pagesize=letter,
-        leftMargin=0.6*inch,
-        rightMargin=0.6*inch,
-        topMargin=0.7*inch,
-        bottomMargin=0.7*inch
-    )
-
-    styles = getSampleStyleSheet()
-
-    # Compact technical style
-    title_style = ParagraphStyle(
-        'CompactTitle',
-        parent=styles['Heading1'],
-        fontName='Courier-Bold',
-        fontSize=14,
-        alignment=TA_CENTER,
-        spaceAfter=15,
-        spaceBefore=10
-    )
-
-    heading_style = ParagraphStyle(
-        'CompactHeading',
-        parent=styles['Heading2'],
-        fontName='Courier-Bold',
-        fontSize=10,
-        spaceAfter=6,
-        spaceBefore=10,
-        textColor=colors.black,
-        backColor=colors.HexColor('#d9d9d9'),
-        borderPadding=3
+        margins=(0.6*inch, 0.6*inch, 0.7*inch, 0.7*inch),
+        title_style=_CONTAINER_TITLE,
+        heading_style=_CONTAINER_HEADING,
+        body_style=_CONTAINER_BODY,
+        spacer_height=0.08*inch
     )
 
-    body_style = ParagraphStyle(
-        'CompactBody',
-        parent=styles['BodyText'],
-        fontName='Courier',
-        fontSize=8,
-        alignment=TA_LEFT,
-        spaceAfter=3,
-        leading=10
-    )
 
-    story = []
-    lines = text_content.split('\n')
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            story.append(Spacer(1, 0.08*inch))
-            continue
-
-        # Title
-        if line == "TIME CHARTER PARTY":
-            story.append(Paragraph(line, title_style))
-        # Main section headers
-        elif line.isupper() and line.endswith(':'):
-            line = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            story.append(Paragraph(line, heading_style))
-        # Regular text
-        else:
-            line = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            story.append(Paragraph(line, body_style))
-
-    doc.build(story)
-    print(f"Generated: {output_path}")
+def _generate_from_file(generator, text_path, output_path):
+    """Read a contract text file and render it with the given layout (worker entry point)."""
+    text_content = read_contract(text_path)
+    generator(text_content, output_path)
+    return output_path
 
 
 def main():
     """Generate all three PDF contracts with different layouts."""
     contracts_dir = Path("sample_contracts")
 
-    # Contract 1: Bulk Carrier - Traditional formal layout
-    print("Generating bulk carrier contract PDF (Traditional layout)...")
-    text1 = read_contract(contracts_dir / "tcp_contract_001.txt")
-    generate_bulk_carrier_pdf(text1, str(contracts_dir / "tcp_contract_001.pdf"))
-
-    # Contract 2: Tanker - Modern business layout
-    print("\nGenerating tanker contract PDF (Modern layout)...")
-    text2 = read_contract(contracts_dir / "tcp_contract_002.txt")
-    generate_tanker_pdf(text2, str(contracts_dir / "tcp_contract_002.pdf"))
-
-    # Contract 3: Container - Compact professional layout
-    print("\nGenerating container vessel contract PDF (Compact layout)...")
-    text3 = read_contract(contracts_dir / "tcp_contract_003.txt")
-    generate_container_pdf(text3, str(contracts_dir / "tcp_contract_003.pdf"))
+    jobs = [
+        # Contract 1: Bulk Carrier - Traditional formal layout
+        ("bulk carrier contract PDF (Traditional layout)",
+         generate_bulk_carrier_pdf, "tcp_contract_001"),
+        # Contract 2: Tanker - Modern business layout
+        ("tanker contract PDF (Modern layout)",
+         generate_tanker_pdf, "tcp_contract_002"),
+        # Contract 3: Container - Compact professional layout
+        ("container vessel contract PDF (Compact layout)",
+         generate_container_pdf, "tcp_contract_003"),
+    ]
+
+    # Rendering is CPU-bound, so run the three layouts in separate processes
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {}
+        for description, generator, stem in jobs:
+            print(f"Generating {description}...")
+            future = executor.submit(
+                _generate_from_file,
+                generator,
+                str(contracts_dir / f"{stem}.txt"),
+                str(contracts_dir / f"{stem}.pdf")
+            )
+            futures[future] = description
+
+        for future in as_completed(futures):
+            future.result()
+            print(f"Finished {futures[future]}")
 
     print("\n" + "="*60)
     print("All PDFs generated successfully!")
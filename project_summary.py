@@ -3,7 +3,7 @@ Project Summary - TCP Document Processing Agent
 Display project status and sample output
 """
 
-import pandas as pd
+from itertools import islice
 from pathlib import Path
 
 def display_summary():
@@ -65,22 +65,39 @@ def display_summary():
 
     sample_excel = output_dir / "tcp_contract_001_extracted.xlsx"
     if sample_excel.exists():
-        df = pd.read_excel(sample_excel)
-        print(f"  File: {sample_excel.name}")
-        print(f"  Total fields extracted: {len(df)}")
-        print(f"\n  Key fields preview:")
+        # Imported here so the summary starts fast when there is no sample yet
+        from openpyxl import load_workbook
 
-        # Show key fields
         key_fields = [
             "Contract Number", "Vessel Name", "Vessel Type",
             "Daily Hire Rate Usd", "Charter Period Months",
             "Delivery Port", "Owner Name"
         ]
 
+        # Field | Value sheet: read in read-only mode, stopping once every key
+        # field is found when the sheet records its own row count
+        wb = load_workbook(sample_excel, read_only=True, data_only=True)
+        ws = wb.active
+        wanted = set(key_fields)
+        values = {}
+        rows_read = 0
+        for row in ws.iter_rows(min_row=2, values_only=True):
+            rows_read += 1
+            if len(row) >= 2 and row[0] in wanted:
+                values.setdefault(row[0], row[1])
+                if len(values) == len(wanted) and ws.max_row:
+                    break
+        total_fields = ws.max_row - 1 if ws.max_row else rows_read
+        wb.close()
+
+        print(f"  File: {sample_excel.name}")
+        print(f"  Total fields extracted: {total_fields}")
+        print(f"\n  Key fields preview:")
+
+        # Show key fields
         for field in key_fields:
-            row = df[df['Field'] == field]
-            if not row.empty:
-                value = row['Value'].values[0]
+            if field in values:
+                value = values[field]
                 # Truncate long values
                 if isinstance(value, str) and len(value) > 50:
                     value = value[:50] + "..."
@@ -115,9 +132,9 @@ def display_summary():
     csv_file = output_dir / "tcp_contract_001_extracted.csv"
     if csv_file.exists():
         print(f"  Example from: {csv_file.name}\n")
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()[:10]
-            for line in lines:
+        with open(csv_file, 'r', encoding='utf-8', buffering=65536) as f:
+            # Only the first 10 lines are shown, so don't read the rest
+            for line in islice(f, 10):
                 print(f"  {line.rstrip()}")
         print("  ...")
 
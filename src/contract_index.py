@@ -0,0 +1,116 @@
+"""
+Vessel-name search index for processed TCP contracts
+
+Keeps the normalized (upper-cased, single-spaced) vessel names and TCP DATE sort keys of a contract list
+in parallel arrays, plus a trigram index over the names. Searches of three or
+more characters only look at contracts sharing every trigram of the query;
+shorter searches are a vectorized substring match over all names. Matches are
+then ordered with an argsort instead of a Python sort over contract dicts.
+"""
+
+from collections import defaultdict
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+
+def _normalize(name: str) -> str:
+    """Upper-case a vessel name and collapse its whitespace."""
+    return ' '.join(name.split()).upper()
+
+
+def _trigrams(text: str) -> set:
+    """All 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class VesselIndex:
+    """Search keys for a list of contracts, kept in the same order as the list."""
+
+    # Sort key for contracts without a TCP DATE (sorts last, descending)
+    MISSING_DATE = '0000-00-00'
+
+    def __init__(self, contracts: list = None):
+        self.clear()
+
+        for contract in contracts or []:
+            self.add(contract)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def vessel_names(self) -> set:
+        """Distinct normalized vessel names (read-only view; do not modify)."""
+        return self._vessel_names
+
+    def add(self, contract: dict) -> None:
+        """Record the search keys of a contract appended to the list."""
+        position = len(self._names)
+        name = _normalize(contract.get('VESSEL NAME') or '')
+
+        self._names.append(name)
+        # ISO strings sort by date; str() gives date/datetime values the same form
+        self._dates.append(str(contract.get('TCP DATE') or self.MISSING_DATE))
+        if name:
+            self._vessel_names.add(name)
+        for trigram in _trigrams(name):
+            self._trigram_positions[trigram].add(position)
+
+        self._names_series = None
+        self._dates_array = None
+
+    def clear(self) -> None:
+        """Forget all contracts."""
+        self._names = []
+        self._dates = []
+        # Distinct (normalized) vessel names
+        self._vessel_names = set()
+        # Trigram -> positions of the names containing it
+        self._trigram_positions = defaultdict(set)
+        # Arrays built from the lists on first search after a change
+        self._names_series = None
+        self._dates_array = None
+
+    def search(self, vessel_name: str) -> List[int]:
+        """
+        Find contracts by vessel name (partial match, ignoring case and
+        extra whitespace).
+
+        Args:
+            vessel_name: Vessel name to search for
+
+        Returns:
+            Positions of the matching contracts, sorted by TCP DATE descending
+            (ties keep list order)
+        """
+        if not self._names:
+            return []
+
+        query = _normalize(vessel_name)
+
+        if self._dates_array is None:
+            self._dates_array = np.array(self._dates, dtype=object)
+
+        if len(query) >= 3:
+            # Candidates contain every trigram of the query; confirm the match
+            # on those only (a query can repeat trigrams out of order)
+            candidates = set.intersection(*(
+                self._trigram_positions.get(trigram, set()) for trigram in _trigrams(query)
+            ))
+            positions = np.array(
+                sorted(i for i in candidates if query in self._names[i]), dtype=np.intp
+            )
+        else:
+            if self._names_series is None:
+                self._names_series = pd.Series(self._names, dtype='string')
+            mask = self._names_series.str.contains(query, regex=False)
+            positions = np.flatnonzero(mask.to_numpy(dtype=bool))
+
+        # Stable descending sort: sort the reversed matches ascending, then
+        # reverse back, so equal dates stay in their original order
+        reversed_positions = positions[::-1]
+        order = np.argsort(self._dates_array[reversed_positions], kind='stable')
+
+        return reversed_positions[order][::-1].tolist()
@@ -10,29 +10,215 @@ Handles:
 """
 
 import re
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Any, Optional
 import pandas as pd
 
 
+def _date_shape(date_str: str) -> str:
+    """
+    Classify a date string by its separators.
+
+    strptime matches separators literally, so a string can only parse with
+    formats of the same shape.
+    """
+    if '/' in date_str:
+        return 'slash'
+    if '-' in date_str:
+        return 'dash'
+    if ',' in date_str:
+        return 'comma'
+    if date_str[:1].isdigit():
+        return 'dot' if '.' in date_str else 'day_first'
+    return 'month_first'
+
+
+def _is_null(value: Any) -> bool:
+    """True for values the standardizers treat as missing: falsy, "null" or NaN."""
+    # NaN is the only value not equal to itself; avoids a pd.isna dispatch
+    return not value or value == "null" or (isinstance(value, float) and value != value)
+
+
+def _to_date(value: Any) -> Any:
+    """Convert an ISO date string to a datetime.date; other values pass through."""
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _group_formats_by_shape(formats: list) -> dict:
+    """Group strptime formats by the shape of the strings they produce."""
+    sample = datetime(2024, 1, 15)
+    grouped = {}
+    for fmt in formats:
+        grouped.setdefault(_date_shape(sample.strftime(fmt)), []).append(fmt)
+    return {shape: tuple(fmts) for shape, fmts in grouped.items()}
+
+
+# English month names -> month number, full and abbreviated (lowercase keys)
+_MONTH_NUMBERS = {
+    name: number
+    for number, (full, abbr) in enumerate(zip(
+        ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+         'august', 'september', 'october', 'november', 'december'],
+        ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
+    ), start=1)
+    for name in (full, abbr)
+}
+
+# Regexes strptime itself uses for each directive in DATE_FORMATS
+_DATE_DIRECTIVES = {
+    '%d': r'(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])',
+    '%m': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+    '%Y': r'(?P<Y>\d\d\d\d)',
+    '%B': r'(?P<B>september|february|november|december|january|october|august|march|april|june|july|may)',
+    '%b': r'(?P<b>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)',
+}
+
+
+def _compile_date_format(fmt: str) -> re.Pattern:
+    """Build the regex strptime would use for a date format, compiled once."""
+    parts = []
+    for token in re.split(r'(%[a-zA-Z]|\s+)', fmt):
+        if token in _DATE_DIRECTIVES:
+            parts.append(_DATE_DIRECTIVES[token])
+        elif token.isspace():
+            parts.append(r'\s+')
+        else:
+            parts.append(re.escape(token))
+    return re.compile(''.join(parts), re.IGNORECASE)
+
+
+def _match_date_format(date_str: str, pattern: re.Pattern) -> Optional[str]:
+    """
+    Parse a date with a precompiled format regex.
+
+    Equivalent to datetime.strptime(date_str, fmt) formatted as YYYY-MM-DD,
+    without raising ValueError on every format that does not match.
+    """
+    match = pattern.fullmatch(date_str)
+    if match is None:
+        return None
+    fields = match.groupdict()
+    if 'm' in fields:
+        month = int(fields['m'])
+    else:
+        month = _MONTH_NUMBERS.get((fields.get('B') or fields['b']).lower())
+        if month is None:
+            return None
+    day = int(fields['d']) if 'd' in fields else 1
+    try:
+        return datetime(int(fields['Y']), month, day).strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
 class TCPDataStandardizer:
     """Standardizes TCP contract data for consistent output."""
 
-    # Common date formats found in TCPs
+    # Common date formats found in TCPs, most frequent first
+    # (%d/%m/%Y must stay ahead of %m/%d/%Y: it decides ambiguous dates)
     DATE_FORMATS = [
         "%B %d, %Y",           # January 15, 2024
-        "%d %B %Y",            # 15 January 2024
         "%b %d, %Y",           # Jan 15, 2024
+        "%d %B %Y",            # 15 January 2024
         "%d %b %Y",            # 15 Jan 2024
-        "%Y-%m-%d",            # 2024-01-15 (ISO)
         "%d/%m/%Y",            # 15/01/2024
         "%m/%d/%Y",            # 01/15/2024
         "%d.%m.%Y",            # 15.01.2024
         "%Y/%m/%d",            # 2024/01/15
+        "%Y-%m-%d",            # 2024-1-15 (ISO is handled by fromisoformat first)
         "%B %Y",               # January 2024 (month only)
         "%b %Y",               # Jan 2024
     ]
 
+    # Column order to match Excel template exactly (53 columns)
+    COLUMN_ORDER = [
+        'VESSEL NAME', 'TRADE', 'TYPE AUTO.', 'TCP DATE', 'CONTRACT TYPE',
+        'OWNERS.', 'CHARTERERS', 'CHARTER LENGTH', 'OPTION PERIODS',
+        'LENGTH OF NEXT OPTION', 'NUMBER OF DAYS PRIOR REDELIVERY DATE TO DECLARE THE OPTION',
+        'OPTION DECLARATION DATE.', 'STTC/ LTTC', 'DELIVERY DATE', 'REDELIVERY DATE',
+        'REDEL CHOP minus DAYS', 'REDEL CHOP plus DAYS', 'REDELIVERY LOCATION',
+        'FIRST REDEL NOTICE', 'EARLIEST REDELIVERY DATE.', 'LATEST REDELIVERY DATE.',
+        'EARLIEST REDELIVERY NOTICE DATE.', 'LATEST REDELIVERY NOTICE DATE',
+        'ALL REDEL NOTICES', 'LAST CARGOES ON REDELIVERY', 'SLOPS ON REDELIVERY',
+        'CLEANING REQUIREMENTS ON REDELIVERY', 'CAN OFFHIRE BE ADDED?(CL 4(B))',
+        'NUMBER OF DAYS PRIOR REDELIVERY DATE TO DECLARE THIS',
+        'OFFHIRE DECLARATION DATE(CL 4(B))', 'OTHER REDELIVERY TERMS (E#G BALLAST BONUS)',
+        'BUNKERS ON REDELIVERY(CL 15)', 'CURRENT TC RATE(CL 8)', 'FIXED/ MARKET RELATED',
+        'BENEFICIAL OWNER (FROM BANK DETAILS)', 'DRY-DOCK LOCATION', 'BROKER',
+        'BROKERS EMAIL', 'Original Annual Anniversary Date', 'Revised Annual Anniversary Date',
+        'IMO NUMBER', 'BUILT', 'FLAG', 'VESSEL EMAIL', 'OWNER EMAIL ADDRESS',
+        'TECHNICAL MANAGER', 'TECHNICAL MANAGER EMAIL ADDRESS', 'P&I CLUB',
+        'H&M VALUE USDM', 'CLASSIFICATION SOCIETY', 'IMO TYPE', 'ICE CLASS', 'DWT'
+    ]
+    _COLUMN_ORDER_SET = frozenset(COLUMN_ORDER)
+
+    # Date fields - converted to ISO format
+    DATE_FIELDS = [
+        'TCP DATE', 'DELIVERY DATE', 'REDELIVERY DATE',
+        'OPTION DECLARATION DATE.', 'EARLIEST REDELIVERY DATE.',
+        'LATEST REDELIVERY DATE.', 'EARLIEST REDELIVERY NOTICE DATE.',
+        'LATEST REDELIVERY NOTICE DATE', 'OFFHIRE DECLARATION DATE(CL 4(B))',
+        'Original Annual Anniversary Date', 'Revised Annual Anniversary Date'
+    ]
+
+    # Numeric fields (integers)
+    NUMERIC_INT_FIELDS = [
+        'NUMBER OF DAYS PRIOR REDELIVERY DATE TO DECLARE THE OPTION',
+        'REDEL CHOP minus DAYS', 'REDEL CHOP plus DAYS',
+        'FIRST REDEL NOTICE', 'NUMBER OF DAYS PRIOR REDELIVERY DATE TO DECLARE THIS',
+        'IMO NUMBER', 'BUILT', 'DWT'
+    ]
+
+    # Email fields
+    EMAIL_FIELDS = [
+        'BROKERS EMAIL', 'VESSEL EMAIL', 'OWNER EMAIL ADDRESS',
+        'TECHNICAL MANAGER EMAIL ADDRESS'
+    ]
+
+    # Text fields (uppercase, cleaned)
+    UPPERCASE_TEXT_FIELDS = [
+        'TRADE', 'TYPE AUTO.', 'CONTRACT TYPE', 'OWNERS.', 'CHARTERERS',
+        'CHARTER LENGTH', 'OPTION PERIODS', 'STTC/ LTTC', 'REDELIVERY LOCATION',
+        'ALL REDEL NOTICES', 'LAST CARGOES ON REDELIVERY', 'SLOPS ON REDELIVERY',
+        'CLEANING REQUIREMENTS ON REDELIVERY', 'OTHER REDELIVERY TERMS (E#G BALLAST BONUS)',
+        'BUNKERS ON REDELIVERY(CL 15)', 'FIXED/ MARKET RELATED',
+        'BENEFICIAL OWNER (FROM BANK DETAILS)', 'DRY-DOCK LOCATION',
+        'BROKER', 'FLAG', 'TECHNICAL MANAGER', 'P&I CLUB',
+        'H&M VALUE USDM', 'CLASSIFICATION SOCIETY', 'IMO TYPE', 'ICE CLASS',
+        'LENGTH OF NEXT OPTION'
+    ]
+
+    # Candidate formats per date shape (keeps DATE_FORMATS priority order)
+    _FORMATS_BY_SHAPE = _group_formats_by_shape(DATE_FORMATS)
+
+    # Precompiled regex for each date format, used instead of strptime
+    _FORMAT_PATTERNS = {fmt: _compile_date_format(fmt) for fmt in DATE_FORMATS}
+
+    # Vessel name prefixes: recognised as-is, and rewritten to canonical form
+    _VESSEL_PREFIXES = ('M/V', 'MT', 'MV', 'M.V.', 'S.S.', 'SS')
+    _VESSEL_PREFIX_REWRITES = {'M.V.': 'M/V', 'MV ': 'M/V', 'M.T.': 'MT'}
+    # Substring match (not whole words), as the original keyword scan did
+    _COMPANY_RE = re.compile(r'LTD|INC|CORP|COMPANY|HOLDINGS|AS|SA|LLC')
+
+    # Precompiled patterns used by the standardize_* methods
+    _ISO_PREFIX_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+    _ISO_BASIC_RE = re.compile(r'(\d{4})(\d{2})(\d{2})')
+    _MONTH_YEAR_RE = re.compile(
+        r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
+        re.IGNORECASE
+    )
+    _YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+    _WS_RE = re.compile(r'\s+')
+    _CURRENCY_STRIP_RE = re.compile(r'[,$€£¥\s]')
+    _NUMBER_RE = re.compile(r'-?\d+\.?\d*')
+    _EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
     @staticmethod
     def standardize_date(date_value: Any) -> Optional[str]:
         """
@@ -44,26 +230,45 @@ class TCPDataStandardizer:
         Returns:
             ISO format date string (YYYY-MM-DD) or None if parsing fails
         """
-        if not date_value or date_value == "null" or pd.isna(date_value):
+        if _is_null(date_value):
             return None
 
-        date_str = str(date_value).strip()
+        return TCPDataStandardizer._parse_date(str(date_value).strip())
 
-        # Already in ISO format
-        if re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
-            return date_str
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_date(date_str: str) -> Optional[str]:
+        """Parse a stripped date string; memoized since dates repeat across fields and contracts."""
+        # ISO date, alone or followed by a time or other text, e.g.
+        # "2024-01-15T10:30" or "2024-01-15 (approx.)". An impossible ISO date
+        # such as "2024-02-30" is returned unchanged rather than reaching the
+        # year-only fallback below, so bad input stays visible
+        if TCPDataStandardizer._ISO_PREFIX_RE.match(date_str):
+            try:
+                return date.fromisoformat(date_str[:10]).isoformat()
+            except ValueError:
+                return date_str
 
-        # Try each date format
-        for fmt in TCPDataStandardizer.DATE_FORMATS:
+        # Basic ISO form, e.g. "20240115" (parsed explicitly: fromisoformat
+        # only accepts it from Python 3.11)
+        basic_match = TCPDataStandardizer._ISO_BASIC_RE.fullmatch(date_str)
+        if basic_match:
             try:
-                parsed_date = datetime.strptime(date_str, fmt)
-                return parsed_date.strftime("%Y-%m-%d")
+                return date(*map(int, basic_match.groups())).isoformat()
             except ValueError:
-                continue
+                return date_str
+
+        # Only try the formats that can match this string's separators
+        candidates = TCPDataStandardizer._FORMATS_BY_SHAPE.get(_date_shape(date_str), ())
+        patterns = TCPDataStandardizer._FORMAT_PATTERNS
+        for fmt in candidates:
+            iso_date = _match_date_format(date_str, patterns[fmt])
+            if iso_date:
+                return iso_date
 
         # Try to extract year-month pattern for partial dates
         # Example: "January 2024" -> "2024-01-01"
-        month_year_match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})', date_str, re.IGNORECASE)
+        month_year_match = TCPDataStandardizer._MONTH_YEAR_RE.search(date_str)
         if month_year_match:
             month_name = month_year_match.group(1)
             year = month_year_match.group(2)
@@ -74,7 +279,7 @@ class TCPDataStandardizer:
                 pass
 
         # Try to extract just year
-        year_match = re.search(r'\b(19|20)\d{2}\b', date_str)
+        year_match = TCPDataStandardizer._YEAR_RE.search(date_str)
         if year_match:
             return f"{year_match.group(0)}-01-01"
 
@@ -92,32 +297,29 @@ class TCPDataStandardizer:
         Returns:
             Standardized vessel name or None
         """
-        if not vessel_name or vessel_name == "null" or pd.isna(vessel_name):
+        if _is_null(vessel_name):
             return None
 
-        name = str(vessel_name).strip()
-
-        # Convert to uppercase
-        name = name.upper()
+        return TCPDataStandardizer._normalize_vessel_name(str(vessel_name))
 
-        # Remove extra whitespace
-        name = re.sub(r'\s+', ' ', name)
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_vessel_name(raw_name: str) -> str:
+        """Normalize a vessel name string (memoized)."""
+        # Uppercase and collapse whitespace
+        name = ' '.join(raw_name.upper().split())
 
         # Ensure common prefixes are present
-        # Add M/V or MT if missing and looks like a vessel name
-        if not re.match(r'^(M/V|MT|MV|M\.V\.|S\.S\.|SS)', name):
-            # Check if it's likely a vessel name (starts with capital letter, not a company name)
-            if not any(keyword in name for keyword in ['LTD', 'INC', 'CORP', 'COMPANY', 'HOLDINGS', 'AS', 'SA', 'LLC']):
-                name = f"M/V {name}"
-
-        # Standardize prefix formats
-        name = re.sub(r'^M\.V\.\s*', 'M/V ', name)
-        name = re.sub(r'^MV\s+', 'M/V ', name)
-        name = re.sub(r'^M\.T\.\s*', 'MT ', name)
-        name = re.sub(r'^MT\s+', 'MT ', name)
-
-        # Clean up any double spaces
-        name = re.sub(r'\s+', ' ', name)
+        # Add M/V if missing and it looks like a vessel name (not a company name)
+        has_prefix = name.startswith(TCPDataStandardizer._VESSEL_PREFIXES)
+        if not has_prefix and TCPDataStandardizer._COMPANY_RE.search(name) is None:
+            name = f"M/V {name}"
+        else:
+            # Standardize prefix formats
+            for prefix, canonical in TCPDataStandardizer._VESSEL_PREFIX_REWRITES.items():
+                if name.startswith(prefix):
+                    name = f"{canonical} {name[len(prefix):].lstrip()}"
+                    break
 
         return name.strip()
 
@@ -132,20 +334,24 @@ class TCPDataStandardizer:
         Returns:
             Extracted numeric value or None
         """
-        if not value or value == "null" or pd.isna(value):
+        if _is_null(value):
             return None
 
         # If already a number
         if isinstance(value, (int, float)):
             return float(value)
 
-        value_str = str(value).strip()
+        return TCPDataStandardizer._parse_number(str(value).strip())
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_number(value_str: str) -> Optional[float]:
+        """Extract the first number from a stripped string (memoized)."""
         # Remove common currency symbols and formatting
-        value_str = re.sub(r'[,$€£¥\s]', '', value_str)
+        value_str = TCPDataStandardizer._CURRENCY_STRIP_RE.sub('', value_str)
 
         # Extract first number found
-        number_match = re.search(r'-?\d+\.?\d*', value_str)
+        number_match = TCPDataStandardizer._NUMBER_RE.search(value_str)
         if number_match:
             try:
                 return float(number_match.group(0))
@@ -182,13 +388,13 @@ class TCPDataStandardizer:
         Returns:
             Cleaned text or None
         """
-        if not value or value == "null" or pd.isna(value):
+        if _is_null(value):
             return None
 
         text = str(value).strip()
 
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = TCPDataStandardizer._WS_RE.sub(' ', text)
 
         # Remove "null" strings
         if text.lower() == "null":
@@ -207,13 +413,17 @@ class TCPDataStandardizer:
         Returns:
             Cleaned email or None if invalid
         """
-        if not value or value == "null" or value == "-" or pd.isna(value):
+        if _is_null(value) or value == "-":
             return None
 
-        email = str(value).strip().lower()
+        return TCPDataStandardizer._validate_email(str(value).strip().lower())
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _validate_email(email: str) -> Optional[str]:
+        """Return a lowercased, stripped email if it looks valid (memoized)."""
         # Basic email validation
-        if re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
+        if TCPDataStandardizer._EMAIL_RE.match(email):
             return email
 
         return None
@@ -229,7 +439,7 @@ class TCPDataStandardizer:
         Returns:
             "Yes" or "No" or None
         """
-        if not value or value == "null" or value == "-" or pd.isna(value):
+        if _is_null(value) or value == "-":
             return None
 
         val_str = str(value).strip().upper()
@@ -252,85 +462,40 @@ class TCPDataStandardizer:
         Returns:
             Standardized contract data dictionary with exact Excel column names
         """
-        standardized = {}
-
-        # Date fields - convert to ISO format
-        date_fields = [
-            'TCP DATE', 'DELIVERY DATE', 'REDELIVERY DATE',
-            'OPTION DECLARATION DATE.', 'EARLIEST REDELIVERY DATE.',
-            'LATEST REDELIVERY DATE.', 'EARLIEST REDELIVERY NOTICE DATE.',
-            'LATEST REDELIVERY NOTICE DATE', 'OFFHIRE DECLARATION DATE(CL 4(B))',
-            'Original Annual Anniversary Date', 'Revised Annual Anniversary Date'
-        ]
-        for field in date_fields:
-            if field in raw_data:
-                standardized[field] = TCPDataStandardizer.standardize_date(raw_data[field])
-
-        # Vessel name (keep original format - don't auto-add M/V)
-        if 'VESSEL NAME' in raw_data:
-            val = raw_data['VESSEL NAME']
-            if val and val != "null" and val != "-":
-                standardized['VESSEL NAME'] = str(val).strip().upper()
-            else:
-                standardized['VESSEL NAME'] = None
-
-        # Numeric fields (integers)
-        numeric_int_fields = [
-            'NUMBER OF DAYS PRIOR REDELIVERY DATE TO DECLARE THE OPTION',
-            'REDEL CHOP minus DAYS', 'REDEL CHOP plus DAYS',
-            'FIRST REDEL NOTICE', 'NUMBER OF DAYS PRIOR REDELIVERY DATE TO DECLARE THIS',
-            'IMO NUMBER', 'BUILT', 'DWT'
-        ]
-        for field in numeric_int_fields:
-            if field in raw_data:
-                numeric = TCPDataStandardizer.extract_numeric_value(raw_data[field])
-                standardized[field] = int(numeric) if numeric is not None else None
-
-        # Currency/rate fields (extract number from "35,000" format)
-        if 'CURRENT TC RATE(CL 8)' in raw_data:
-            rate_val = raw_data['CURRENT TC RATE(CL 8)']
-            if rate_val and rate_val != "null" and rate_val != "-":
-                # Keep as string to preserve format like "35,000"
-                standardized['CURRENT TC RATE(CL 8)'] = str(rate_val).strip()
-            else:
-                standardized['CURRENT TC RATE(CL 8)'] = None
-
-        # Email fields
-        email_fields = [
-            'BROKERS EMAIL', 'VESSEL EMAIL', 'OWNER EMAIL ADDRESS',
-            'TECHNICAL MANAGER EMAIL ADDRESS'
-        ]
-        for field in email_fields:
-            if field in raw_data:
-                standardized[field] = TCPDataStandardizer.standardize_email(raw_data[field])
-
-        # Boolean fields (Yes/No)
-        if 'CAN OFFHIRE BE ADDED?(CL 4(B))' in raw_data:
-            standardized['CAN OFFHIRE BE ADDED?(CL 4(B))'] = TCPDataStandardizer.standardize_boolean(
-                raw_data['CAN OFFHIRE BE ADDED?(CL 4(B))']
-            )
-
-        # Text fields (uppercase, cleaned)
-        uppercase_text_fields = [
-            'TRADE', 'TYPE AUTO.', 'CONTRACT TYPE', 'OWNERS.', 'CHARTERERS',
-            'CHARTER LENGTH', 'OPTION PERIODS', 'STTC/ LTTC', 'REDELIVERY LOCATION',
-            'ALL REDEL NOTICES', 'LAST CARGOES ON REDELIVERY', 'SLOPS ON REDELIVERY',
-            'CLEANING REQUIREMENTS ON REDELIVERY', 'OTHER REDELIVERY TERMS (E#G BALLAST BONUS)',
-            'BUNKERS ON REDELIVERY(CL 15)', 'FIXED/ MARKET RELATED',
-            'BENEFICIAL OWNER (FROM BANK DETAILS)', 'DRY-DOCK LOCATION',
-            'BROKER', 'FLAG', 'TECHNICAL MANAGER', 'P&I CLUB',
-            'H&M VALUE USDM', 'CLASSIFICATION SOCIETY', 'IMO TYPE', 'ICE CLASS',
-            'LENGTH OF NEXT OPTION'
-        ]
-        for field in uppercase_text_fields:
-            if field in raw_data:
-                val = raw_data[field]
-                if val and val != "null" and val != "-" and not pd.isna(val):
-                    standardized[field] = str(val).strip().upper()
-                else:
-                    standardized[field] = val if val == "-" else None
-
-        return standardized
+        # One pass over the input; fields outside the template are dropped
+        transforms = TCPDataStandardizer._FIELD_TRANSFORMS
+        return {
+            field: transforms[field](value)
+            for field, value in raw_data.items()
+            if field in transforms
+        }
+
+    @staticmethod
+    def _standardize_vessel_field(value: Any) -> Optional[str]:
+        """Vessel name column: uppercase only (keep original format - don't auto-add M/V)."""
+        if not _is_null(value) and value != "-":
+            return str(value).strip().upper()
+        return None
+
+    @staticmethod
+    def _standardize_int_field(value: Any) -> Optional[int]:
+        """Integer column: first number in the value, truncated."""
+        numeric = TCPDataStandardizer.extract_numeric_value(value)
+        return int(numeric) if numeric is not None else None
+
+    @staticmethod
+    def _standardize_rate_field(value: Any) -> Optional[str]:
+        """Rate column: kept as a string to preserve format like "35,000"."""
+        if not _is_null(value) and value != "-":
+            return str(value).strip()
+        return None
+
+    @staticmethod
+    def _standardize_upper_text_field(value: Any) -> Optional[str]:
+        """Text column: uppercase and trimmed, with "-" kept as-is."""
+        if not _is_null(value) and value != "-":
+            return str(value).strip().upper()
+        return value if value == "-" else None
 
     @staticmethod
     def create_standardized_dataframe(contract_data: dict) -> pd.DataFrame:
@@ -343,17 +508,11 @@ class TCPDataStandardizer:
         Returns:
             pandas DataFrame with two columns: Field and Value
         """
-        # Convert to list of dicts for DataFrame
-        rows = []
-        for field, value in contract_data.items():
-            display_name = field.replace('_', ' ').title()
-            rows.append({
-                'Field': display_name,
-                'Value': value
-            })
-
-        df = pd.DataFrame(rows)
-        return df
+        # Build the two columns directly rather than a list of row dicts
+        fields = [field.replace('_', ' ').title() for field in contract_data]
+        values = list(contract_data.values())
+
+        return pd.DataFrame({'Field': fields, 'Value': values}, copy=False)
 
     @staticmethod
     def create_columnar_dataframe(contracts: list) -> pd.DataFrame:
@@ -365,42 +524,40 @@ class TCPDataStandardizer:
             contracts: List of standardized contract data dictionaries
 
         Returns:
-            pandas DataFrame with contracts as rows
+            pandas DataFrame with contracts as rows (date columns hold datetime.date)
         """
         if not contracts:
             return pd.DataFrame()
 
-        # Define column order to match Excel template exactly (53 columns)
-        column_order = [
-            'VESSEL NAME', 'TRADE', 'TYPE AUTO.', 'TCP DATE', 'CONTRACT TYPE',
-            'OWNERS.', 'CHARTERERS', 'CHARTER LENGTH', 'OPTION PERIODS',
-            'LENGTH OF NEXT OPTION', 'NUMBER OF DAYS PRIOR REDELIVERY DATE TO DECLARE THE OPTION',
-            'OPTION DECLARATION DATE.', 'STTC/ LTTC', 'DELIVERY DATE', 'REDELIVERY DATE',
-            'REDEL CHOP minus DAYS', 'REDEL CHOP plus DAYS', 'REDELIVERY LOCATION',
-            'FIRST REDEL NOTICE', 'EARLIEST REDELIVERY DATE.', 'LATEST REDELIVERY DATE.',
-            'EARLIEST REDELIVERY NOTICE DATE.', 'LATEST REDELIVERY NOTICE DATE',
-            'ALL REDEL NOTICES', 'LAST CARGOES ON REDELIVERY', 'SLOPS ON REDELIVERY',
-            'CLEANING REQUIREMENTS ON REDELIVERY', 'CAN OFFHIRE BE ADDED?(CL 4(B))',
-            'NUMBER OF DAYS PRIOR REDELIVERY DATE TO DECLARE THIS',
-            'OFFHIRE DECLARATION DATE(CL 4(B))', 'OTHER REDELIVERY TERMS (E#G BALLAST BONUS)',
-            'BUNKERS ON REDELIVERY(CL 15)', 'CURRENT TC RATE(CL 8)', 'FIXED/ MARKET RELATED',
-            'BENEFICIAL OWNER (FROM BANK DETAILS)', 'DRY-DOCK LOCATION', 'BROKER',
-            'BROKERS EMAIL', 'Original Annual Anniversary Date', 'Revised Annual Anniversary Date',
-            'IMO NUMBER', 'BUILT', 'FLAG', 'VESSEL EMAIL', 'OWNER EMAIL ADDRESS',
-            'TECHNICAL MANAGER', 'TECHNICAL MANAGER EMAIL ADDRESS', 'P&I CLUB',
-            'H&M VALUE USDM', 'CLASSIFICATION SOCIETY', 'IMO TYPE', 'ICE CLASS', 'DWT'
-        ]
-
-        df = pd.DataFrame(contracts)
-
-        # Reorder columns (only include those that exist)
-        existing_cols = [col for col in column_order if col in df.columns]
-        other_cols = [col for col in df.columns if col not in column_order]
-        final_cols = existing_cols + other_cols
-
-        df = df[final_cols]
-
-        return df
+        # Column order: template columns present, then any others as first seen
+        present = dict.fromkeys(key for contract in contracts for key in contract)
+        existing_cols = [col for col in TCPDataStandardizer.COLUMN_ORDER if col in present]
+        other_cols = [col for col in present if col not in TCPDataStandardizer._COLUMN_ORDER_SET]
+
+        # One list per column (missing fields become None), built in final order
+        columns = {
+            col: [contract.get(col) for contract in contracts]
+            for col in existing_cols + other_cols
+        }
+
+        # ISO date strings become date objects, written as real dates by Excel
+        for col in TCPDataStandardizer.DATE_FIELDS:
+            if col in columns:
+                columns[col] = [_to_date(value) for value in columns[col]]
+
+        return pd.DataFrame(columns, copy=False)
+
+
+# Field -> transform table for standardize_contract_data (built once the methods exist)
+TCPDataStandardizer._FIELD_TRANSFORMS = {
+    **dict.fromkeys(TCPDataStandardizer.DATE_FIELDS, TCPDataStandardizer.standardize_date),
+    'VESSEL NAME': TCPDataStandardizer._standardize_vessel_field,
+    **dict.fromkeys(TCPDataStandardizer.NUMERIC_INT_FIELDS, TCPDataStandardizer._standardize_int_field),
+    'CURRENT TC RATE(CL 8)': TCPDataStandardizer._standardize_rate_field,
+    **dict.fromkeys(TCPDataStandardizer.EMAIL_FIELDS, TCPDataStandardizer.standardize_email),
+    'CAN OFFHIRE BE ADDED?(CL 4(B))': TCPDataStandardizer.standardize_boolean,
+    **dict.fromkeys(TCPDataStandardizer.UPPERCASE_TEXT_FIELDS, TCPDataStandardizer._standardize_upper_text_field),
+}
 
 
 def standardize_and_validate(raw_data: dict) -> dict:
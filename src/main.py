@@ -5,13 +5,18 @@ This module provides functionality to extract and process time charter party
 contract data from PDF documents using Claude AI and export to Excel format.
 """
 
+import argparse
+import hashlib
+import importlib.util
+import io
+import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-import pdfplumber
-import pandas as pd
-from anthropic import Anthropic
 from dotenv import load_dotenv
-from src.data_standardization import standardize_and_validate, TCPDataStandardizer
 
 # Load environment variables
 load_dotenv()
@@ -21,92 +26,53 @@ PROJECT_ROOT = Path(__file__).parent.parent
 CONTRACTS_DIR = PROJECT_ROOT / "sample_contracts"
 OUTPUT_DIR = PROJECT_ROOT / "output"
 
-
-def extract_text_from_pdf(pdf_path: str) -> str:
-    """
-    Extract text content from a PDF file.
-
-    Args:
-        pdf_path (str): Path to the PDF file
-
-    Returns:
-        str: Extracted text content from the PDF
-    """
-    try:
-        # Open the PDF file with pdfplumber
-        with pdfplumber.open(pdf_path) as pdf:
-            # Extract text from all pages
-            text_content = []
-
-            for page_num, page in enumerate(pdf.pages, start=1):
-                # Extract text from current page
-                page_text = page.extract_text()
-
-                if page_text:
-                    # Add page separator for multi-page PDFs
-                    if page_num > 1:
-                        text_content.append(f"\n--- Page {page_num} ---\n")
-                    text_content.append(page_text)
-                else:
-                    print(f"Warning: No text found on page {page_num}")
-
-            # Combine all text
-            full_text = "\n".join(text_content)
-
-            # Clean up excessive whitespace while preserving structure
-            # Replace multiple consecutive blank lines with max 2 blank lines
-            import re
-            full_text = re.sub(r'\n{3,}', '\n\n', full_text)
-
-            return full_text.strip()
-
-    except FileNotFoundError:
-        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-    except Exception as e:
-        raise Exception(f"Error extracting text from PDF: {str(e)}")
-
-
-def extract_contract_data(text: str, max_retries: int = 3) -> dict:
-    """
-    Extract structured contract data from text using Claude AI.
-
-    Args:
-        text (str): Raw text extracted from PDF
-        max_retries (int): Maximum number of retry attempts (default: 3)
-
-    Returns:
-        dict: Structured contract data including:
-            - vessel_name
-            - charter_period
-            - hire_rate
-            - delivery_port
-            - redelivery_port
-            - other relevant TCP fields
-
-    Raises:
-        ValueError: If API key is not found
-        Exception: If extraction fails after all retries
-    """
-    # Initialize Anthropic client
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY not found in environment variables")
-
-    client = Anthropic(api_key=api_key)
-
-    # Estimate token usage for cost tracking
-    input_tokens_estimate = len(text.split()) * 1.3  # Rough estimate
-    print(f"  - Estimated input tokens: ~{int(input_tokens_estimate)}")
-
-    # Create prompt for contract data extraction - Updated to match Excel template (53 fields)
-    prompt = f"""Please analyze this Time Charter Party (TCP) contract and extract the following information into a structured format.
-
-CONTRACT TEXT:
-{text}
-
-Please extract and return ONLY the following fields in valid JSON format. If a field is not found or not applicable, use null or "-" for text fields:
-
-{{
+# Contracts extracted concurrently in a batch run
+MAX_WORKERS = 8
+
+# Excel writer: xlsxwriter is faster when installed, openpyxl is always available
+EXCEL_WRITER = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') else 'openpyxl'
+
+# Parquet export needs pyarrow (optional)
+PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# Pages sent to Claude on the first pass; the whole document is only sent when
+# the first pass misses one of KEY_FIELDS
+MAX_EXTRACTION_PAGES = 30
+KEY_FIELDS = (
+    'VESSEL NAME', 'OWNERS.', 'CHARTERERS', 'CURRENT TC RATE(CL 8)',
+    'DELIVERY DATE', 'REDELIVERY DATE'
+)
+
+# Claude model used for extraction (CLAUDE_MODEL in .env overrides it)
+DEFAULT_CLAUDE_MODEL = "claude-sonnet-4-20250514"
+CLAUDE_MODEL = os.getenv("CLAUDE_MODEL", DEFAULT_CLAUDE_MODEL)
+
+# USD per million tokens (input, output) for the cost estimate; models not
+# listed are estimated at the default model's prices
+_MODEL_PRICES_PER_MTOK = {
+    "claude-sonnet-4-20250514": (3.00, 15.00),
+    "claude-haiku-4-5": (1.00, 5.00),
+}
+INPUT_PRICE_PER_MTOK, OUTPUT_PRICE_PER_MTOK = _MODEL_PRICES_PER_MTOK.get(
+    CLAUDE_MODEL, _MODEL_PRICES_PER_MTOK[DEFAULT_CLAUDE_MODEL]
+)
+
+# Extraction results keyed by a hash of model + full prompt, so re-processing an
+# identical contract skips the Claude API call
+EXTRACTION_CACHE_DIR = OUTPUT_DIR / ".cache"
+
+# EXTRACTION_CACHE_MODE values: whether the cache is read and/or written
+_CACHE_MODES = {
+    'on': (True, True),
+    'read_only': (True, False),
+    'write_only': (False, True),
+    # Re-extract and overwrite the cached results
+    'refresh': (False, True),
+    'off': (False, False),
+}
+
+# Fields to extract (53, matching the Excel template) and what each one holds
+_EXTRACTION_FIELDS = {
     "VESSEL NAME": "Full name of the vessel (e.g., M/T ADVANTAGE ATOM)",
     "TRADE": "Type of trade/cargo (e.g., CRUDE, CLEAN, LNG, PRODUCTS)",
     "TYPE AUTO.": "Vessel size/type category (e.g., Aframax, VLCC, Suezmax, Panamax)",
@@ -160,126 +126,497 @@ Please extract and return ONLY the following fields in valid JSON format. If a f
     "IMO TYPE": "IMO ship type classification (use '-' if not specified)",
     "ICE CLASS": "Ice class rating (use '-' if not specified)",
     "DWT": "Deadweight tonnage (numeric)"
-}}
+}
+
+# Claude returns the fields by calling this tool, so the reply is always a
+# parsed object rather than free-form JSON text
+_EXTRACTION_TOOL = {
+    "name": "extract_tcp_fields",
+    "description": "Record the fields extracted from a Time Charter Party (TCP) contract.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            field: {"type": ["string", "number", "null"], "description": description}
+            for field, description in _EXTRACTION_FIELDS.items()
+        },
+        "required": list(_EXTRACTION_FIELDS)
+    }
+}
+
+# Extraction instructions; identical for every contract and sent first,
+# marked for prompt caching
+_EXTRACTION_INSTRUCTIONS = """Please analyze the Time Charter Party (TCP) contract below and extract its fields by calling the extract_tcp_fields tool.
 
 IMPORTANT NOTES:
-- Return ONLY valid JSON with these exact field names (case-sensitive, including punctuation)
+- Provide every field, using the exact field names (case-sensitive, including punctuation)
 - Use null for dates/numbers that are not found
 - Use "-" for text fields that are not specified or not applicable
 - For dates, use YYYY-MM-DD format if possible
 - For ALL REDEL NOTICES, extract the complete notice schedule text exactly as written
 - Extract numeric values without currency symbols or units where specified
-- If contract uses different terminology, infer the equivalent field value
+- If contract uses different terminology, infer the equivalent field value"""
+
+# System prompt block sent with every request; the tool schema and these
+# instructions form the prompt-cache prefix (~2.3k tokens, enough for Sonnet 4's
+# 1,024-token minimum; models with a higher minimum just skip caching)
+_SYSTEM_PROMPT = [
+    {
+        "type": "text",
+        "text": _EXTRACTION_INSTRUCTIONS,
+        "cache_control": {"type": "ephemeral"}
+    }
+]
+
+# Per-contract part of the prompt, sent after the cached instructions
+_CONTRACT_PROMPT_TEMPLATE = """CONTRACT TEXT:
+{text}"""
+
+# Extraction cache keys hash the static request parts first; this hasher has
+# already consumed them and is copied for each contract
+_CACHE_KEY_PREFIX = hashlib.sha256(
+    f"{CLAUDE_MODEL}\n{json.dumps(_EXTRACTION_TOOL)}\n{_EXTRACTION_INSTRUCTIONS}\n".encode('utf-8')
+)
+
+
+def _extract_document_text(pdf, page_markers: bool, max_pages: int = None) -> str:
+    """
+    Extract and clean the text of an open PyMuPDF document.
+
+    Args:
+        pdf (pymupdf.Document): Open PDF document
+        page_markers (bool): Insert "--- Page N ---" lines between pages
+        max_pages (int): Only read the first max_pages pages (None: all)
+
+    Returns:
+        str: Extracted text content
+    """
+    # Accumulate page text in one buffer, one blank line between pages
+    buf = io.StringIO()
+
+    for page_num, page in enumerate(islice(pdf, max_pages), start=1):
+        # A page without font resources has no text layer (e.g. a scanned
+        # annex); skip it without decoding its image-heavy content stream
+        if not page.get_fonts():
+            print(f"Warning: No text found on page {page_num}")
+            continue
+
+        # Extract text from current page
+        page_text = page.get_text("text").strip()
+
+        if page_text:
+            if buf.tell():
+                buf.write("\n\n")
+            # Optional page separator for multi-page PDFs
+            if page_markers and page_num > 1:
+                buf.write(f"--- Page {page_num} ---\n\n")
+            buf.write(page_text)
+        else:
+            print(f"Warning: No text found on page {page_num}")
+
+    full_text = buf.getvalue()
+
+    # Clean up excessive whitespace while preserving structure
+    # Replace multiple consecutive blank lines with max 2 blank lines
+    # (plain str.replace passes; each one shortens every run by about a third)
+    while "\n\n\n" in full_text:
+        full_text = full_text.replace("\n\n\n", "\n\n")
+
+    return full_text.strip()
+
+
+def missing_key_fields(contract_data: dict) -> list:
+    """
+    List the KEY_FIELDS that Claude left empty.
+
+    Args:
+        contract_data (dict): Raw contract data as returned by Claude
+
+    Returns:
+        list: Names of the missing key fields
+    """
+    return [field for field in KEY_FIELDS if contract_data.get(field) in (None, '', '-')]
+
+
+def count_lines(text: str) -> int:
+    """Number of lines in text, without building a list of them."""
+    if not text:
+        return 0
+    return text.count('\n') + (not text.endswith('\n'))
+
+
+def count_words(text: str) -> int:
+    """
+    Number of whitespace-separated words in text.
+
+    Splits one line at a time, so only a line's words are held in memory
+    (still several times faster than counting regex matches).
+    """
+    return sum(map(len, map(str.split, io.StringIO(text))))
+
+
+def count_pdf_pages(pdf_path: str) -> int:
+    """Number of pages in a PDF file (opens the document without reading any page)."""
+    import pymupdf
+
+    with pymupdf.open(pdf_path) as pdf:
+        return pdf.page_count
+
+
+def count_pdf_pages_bytes(pdf_bytes: bytes) -> int:
+    """Number of pages in PDF data held in memory."""
+    import pymupdf
+
+    with pymupdf.open(stream=pdf_bytes, filetype="pdf") as pdf:
+        return pdf.page_count
+
+
+def extract_text_from_pdf(pdf_path: str, page_markers: bool = False, max_pages: int = None) -> str:
+    """
+    Extract text content from a PDF file.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+        page_markers (bool): Insert "--- Page N ---" lines between pages (debugging aid)
+        max_pages (int): Only read the first max_pages pages (None: all)
+
+    Returns:
+        str: Extracted text content from the PDF
+    """
+    # Imported on first use to keep module import (and CLI startup) fast
+    import pymupdf
+
+    if not Path(pdf_path).is_file():
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+    try:
+        # Open the PDF file with PyMuPDF (much faster than pdfminer-based parsers)
+        with pymupdf.open(pdf_path) as pdf:
+            return _extract_document_text(pdf, page_markers, max_pages)
+
+    except Exception as e:
+        raise Exception(f"Error extracting text from PDF: {str(e)}")
+
+
+def extract_text_from_pdf_bytes(pdf_bytes: bytes, page_markers: bool = False, max_pages: int = None) -> str:
+    """
+    Extract text content from PDF data held in memory (e.g. an upload).
+
+    Args:
+        pdf_bytes (bytes): Raw PDF file content
+        page_markers (bool): Insert "--- Page N ---" lines between pages (debugging aid)
+        max_pages (int): Only read the first max_pages pages (None: all)
+
+    Returns:
+        str: Extracted text content from the PDF
+    """
+    import pymupdf
 
-Return ONLY valid JSON, no other text or explanation."""
+    try:
+        # Opened straight from memory: no temporary file
+        with pymupdf.open(stream=pdf_bytes, filetype="pdf") as pdf:
+            return _extract_document_text(pdf, page_markers, max_pages)
+
+    except Exception as e:
+        raise Exception(f"Error extracting text from PDF: {str(e)}")
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> "Anthropic":
+    """
+    Return the shared Anthropic client, created on first use.
 
-    import json
-    import re
-    import time
+    Reusing one client keeps its HTTP connection pool across contracts.
+
+    Raises:
+        ValueError: If API key is not found
+    """
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY not found in environment variables")
 
-    # Retry loop with exponential backoff
+    from anthropic import Anthropic
+
+    # The client retries connection errors, 429 and 5xx responses with backoff
+    return Anthropic(api_key=api_key, max_retries=2)
+
+
+def _read_cached_extraction(cache_path: Path):
+    """Return a cached extraction result, or None if missing or unreadable."""
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, dict) and cached else None
+
+
+def _write_cached_extraction(cache_path: Path, contract_data: dict) -> None:
+    """Store an extraction result; a failed write only costs a future cache miss."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary name first so concurrent readers never see a partial file
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(contract_data, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"  - Warning: Could not write extraction cache: {e}")
+
+
+def extract_contract_data(text: str, max_retries: int = 3, use_cache: bool = True) -> dict:
+    """
+    Extract structured contract data from text using Claude AI.
+
+    Args:
+        text (str): Raw text extracted from PDF
+        max_retries (int): Maximum number of retry attempts (default: 3)
+        use_cache (bool): Reuse a previous result for identical contract text
+            (stored under output/.cache; the EXTRACTION_CACHE_MODE environment
+            variable - on, read_only, write_only, refresh or off - narrows this further)
+
+    Returns:
+        dict: Structured contract data including:
+            - vessel_name
+            - charter_period
+            - hire_rate
+            - delivery_port
+            - redelivery_port
+            - other relevant TCP fields
+
+    Raises:
+        ValueError: If API key is not found, or EXTRACTION_CACHE_MODE is invalid
+        Exception: If the API call fails, or no usable tool call is returned after all retries
+    """
+    cache_mode = os.getenv("EXTRACTION_CACHE_MODE", "on").strip().lower()
+    if cache_mode not in _CACHE_MODES:
+        raise ValueError(
+            f"Invalid EXTRACTION_CACHE_MODE '{cache_mode}'. Use one of: {', '.join(_CACHE_MODES)}"
+        )
+    read_cache, write_cache = (use_cache and enabled for enabled in _CACHE_MODES[cache_mode])
+
+    contract_prompt = _CONTRACT_PROMPT_TEMPLATE.format(text=text)
+
+    key_hash = _CACHE_KEY_PREFIX.copy()
+    key_hash.update(contract_prompt.encode('utf-8'))
+    cache_key = key_hash.hexdigest()
+    cache_path = EXTRACTION_CACHE_DIR / f"{cache_key}.json"
+    if read_cache:
+        cached = _read_cached_extraction(cache_path)
+        if cached is not None:
+            print(f"  - Using cached extraction ({len(cached)} fields)")
+            return cached
+
+    client = _get_client()
+
+    # Estimate token usage for cost tracking
+    input_tokens_estimate = len(text) // 4  # Rough estimate: ~4 characters per token
+    print(f"  - Estimated input tokens: ~{input_tokens_estimate}")
+
+    # Retry only when Claude's reply cannot be used (no or incomplete tool call).
+    # Transient HTTP failures (connection errors, 429, 5xx) are already retried
+    # with backoff by the Anthropic client, so API errors are not retried here
     last_error = None
     for attempt in range(1, max_retries + 1):
         try:
             if attempt > 1:
-                wait_time = 2 ** (attempt - 1)  # Exponential backoff: 2, 4, 8 seconds
-                print(f"  - Retrying in {wait_time} seconds... (attempt {attempt}/{max_retries})")
-                time.sleep(wait_time)
+                print(f"  - Retrying... (attempt {attempt}/{max_retries})")
 
             # Send request to Claude API
             message = client.messages.create(
-                model="claude-sonnet-4-20250514",
+                model=CLAUDE_MODEL,
                 max_tokens=3000,  # Increased for 53 fields (was 2000 for 33 fields)
+                # Forced tool call: the fields come back as an already-parsed object
+                tools=[_EXTRACTION_TOOL],
+                tool_choice={"type": "tool", "name": _EXTRACTION_TOOL["name"]},
+                # Static instructions (and the tool schema before them): cached
+                # by the API, so later contracts are billed a fraction of these tokens
+                system=_SYSTEM_PROMPT,
                 messages=[
-                    {"role": "user", "content": prompt}
+                    {
+                        "role": "user",
+                        "content": contract_prompt
+                    }
                 ]
             )
 
             # Display actual token usage
             input_tokens = message.usage.input_tokens
             output_tokens = message.usage.output_tokens
-            estimated_cost = (input_tokens * 0.003 / 1000) + (output_tokens * 0.015 / 1000)
+            cache_write_tokens = getattr(message.usage, 'cache_creation_input_tokens', None) or 0
+            cache_read_tokens = getattr(message.usage, 'cache_read_input_tokens', None) or 0
+            # Cache writes are billed at 1.25x the input price, cache reads at 0.1x
+            estimated_cost = (
+                (input_tokens + cache_write_tokens * 1.25 + cache_read_tokens * 0.1) * INPUT_PRICE_PER_MTOK
+                + output_tokens * OUTPUT_PRICE_PER_MTOK
+            ) / 1_000_000
 
             print(f"  - Actual tokens: {input_tokens} input, {output_tokens} output")
+            if cache_write_tokens or cache_read_tokens:
+                print(f"  - Prompt cache: {cache_read_tokens} read, {cache_write_tokens} written")
             print(f"  - Estimated cost: ${estimated_cost:.4f}")
 
-            # Extract the response text
-            response_text = message.content[0].text.strip()
+            if message.stop_reason == "max_tokens":
+                raise ValueError("Claude's reply was cut off at max_tokens")
+            tool_use = next((block for block in message.content if block.type == "tool_use"), None)
+            if tool_use is None:
+                raise ValueError("Claude did not call the extraction tool")
 
-            # Remove markdown code blocks if present
-            # Strip markdown code fences (```json and ```)
-            if response_text.startswith('```'):
-                # Remove opening ```json or ```
-                response_text = re.sub(r'^```(?:json)?\s*\n', '', response_text)
-                # Remove closing ```
-                response_text = re.sub(r'\n```\s*$', '', response_text)
-                response_text = response_text.strip()
-
-            # Parse JSON response
-            contract_data = json.loads(response_text)
+            contract_data = tool_use.input
 
             # Validate that we got a dictionary with data
             if not isinstance(contract_data, dict) or len(contract_data) == 0:
                 raise ValueError("Received empty or invalid data structure from Claude")
 
             print(f"  - Successfully extracted {len(contract_data)} fields")
+            if write_cache:
+                _write_cached_extraction(cache_path, contract_data)
             return contract_data
 
-        except json.JSONDecodeError as e:
-            last_error = f"JSON parsing error: {e}"
-            print(f"  - Error: Failed to parse JSON response from Claude: {e}")
-            if attempt == max_retries:
-                print(f"  - Response was: {response_text[:500] if 'response_text' in locals() else 'No response'}")
+        except ValueError as e:
+            last_error = str(e)
+            print(f"  - Error: {e} (attempt {attempt}/{max_retries})")
 
         except Exception as e:
-            last_error = str(e)
-            print(f"  - Error during Claude API call (attempt {attempt}/{max_retries}): {e}")
+            error_msg = f"Failed to extract contract data: {e}"
+            print(f"  - Error during Claude API call: {e}")
+            raise Exception(error_msg) from e
 
-        # If this was the last attempt, raise the error
-        if attempt == max_retries:
-            error_msg = f"Failed to extract contract data after {max_retries} attempts. Last error: {last_error}"
-            print(f"  - {error_msg}")
-            raise Exception(error_msg)
+    error_msg = f"Failed to extract contract data after {max_retries} attempts. Last error: {last_error}"
+    print(f"  - {error_msg}")
+    raise Exception(error_msg)
 
 
-def export_to_excel(contract_data: dict, output_filename: str) -> None:
+def write_excel(df, output, sheet_name: str) -> None:
+    """
+    Write a DataFrame to an .xlsx file as a raw table (header row + data rows).
+
+    Uses xlsxwriter in constant-memory mode when it is installed, otherwise an
+    openpyxl write-only workbook; both stream rows out instead of building a
+    styled cell grid the way DataFrame.to_excel does.
+
+    Args:
+        df (pd.DataFrame): Table to write
+        output: File path or binary file-like object (e.g. io.BytesIO)
+        sheet_name (str): Worksheet title
+    """
+    # Missing values become empty cells
+    rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+
+    if EXCEL_WRITER == 'xlsxwriter':
+        import xlsxwriter
+
+        wb = xlsxwriter.Workbook(output, {
+            'constant_memory': True,
+            'default_date_format': 'yyyy-mm-dd',
+            # Keep text such as "2024-01-05" or "=..." exactly as extracted
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+        })
+        ws = wb.add_worksheet(sheet_name)
+        ws.write_row(0, 0, list(df.columns))
+        for row_num, row in enumerate(rows, start=1):
+            ws.write_row(row_num, 0, row)
+        wb.close()
+        return
+
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+    ws.append(list(df.columns))
+    for row in rows:
+        ws.append(row)
+    wb.save(output)
+
+
+def write_parquet(df, output) -> None:
+    """
+    Write a DataFrame to a zstd-compressed Parquet file (requires pyarrow).
+
+    Much faster to write and smaller than .xlsx for bulk exports.
+
+    Args:
+        df (pd.DataFrame): Table to write
+        output: File path or binary file-like object (e.g. io.BytesIO)
+    """
+    from pandas.api.types import infer_dtype
+
+    # Parquet columns need one type: columns mixing e.g. numbers and "-" are
+    # stored as text (missing values stay null)
+    mixed = [
+        col for col in df.columns
+        if df[col].dtype == object and infer_dtype(df[col], skipna=True) in ('mixed', 'mixed-integer')
+    ]
+    if mixed:
+        df = df.assign(**{
+            col: df[col].map(lambda value: value if value is None else str(value))
+            for col in mixed
+        })
+
+    df.to_parquet(output, engine='pyarrow', compression='zstd', index=False)
+
+
+def export_to_excel(contract_data: dict, output_filename: str, export_format: str = 'xlsx') -> None:
     """
     Export contract data to Excel file in simple tabular format.
 
     Args:
         contract_data (dict): Structured contract data
         output_filename (str): Name of the output Excel file
+        export_format (str): 'xlsx' (default) or 'csv' (same table, written with
+            a .csv suffix; much faster for large batches)
     """
-    # Convert dictionary to simple two-column format: Field | Value
-    # This makes it easy to convert to CSV later
-    data_rows = []
-
-    for field_name, field_value in contract_data.items():
-        # Convert field name from snake_case to Title Case
-        display_name = field_name.replace('_', ' ').title()
-        data_rows.append({
-            'Field': display_name,
-            'Value': field_value
-        })
+    if export_format not in ('xlsx', 'csv'):
+        raise ValueError(f"Unsupported export format: {export_format}")
 
-    # Create DataFrame with simple two-column structure
-    df = pd.DataFrame(data_rows)
+    # Imported on first use: pulls in pandas, which is slow to import
+    from src.data_standardization import TCPDataStandardizer
+
+    # Convert dictionary to simple two-column format: Field | Value
+    # (field names in Title Case). This makes it easy to convert to CSV later
+    df = TCPDataStandardizer.create_standardized_dataframe(contract_data)
 
     # Construct full output path
     output_path = OUTPUT_DIR / output_filename
 
-    # Export to Excel without any formatting (raw table)
-    # This makes it easy to convert to CSV
-    df.to_excel(
-        output_path,
-        index=False,
-        engine='openpyxl',
-        sheet_name='Contract Data'
-    )
+    if export_format == 'csv':
+        output_path = output_path.with_suffix('.csv')
+        df.to_csv(output_path, index=False)
+    else:
+        # Export to Excel without any formatting (raw table)
+        # This makes it easy to convert to CSV
+        write_excel(df, output_path, sheet_name='Contract Data')
 
     print(f"Exported to: {output_path}")
 
 
+def extract_raw_contract(pdf_path: str) -> dict:
+    """
+    Extract the raw (unstandardized) contract fields from a PDF using Claude.
+
+    Args:
+        pdf_path (str): Path to the PDF contract file
+
+    Returns:
+        dict: Raw contract data as returned by Claude
+    """
+    # Extract text from the first pages only; annexes rarely hold the key terms
+    print("Extracting text from PDF...")
+    text = extract_text_from_pdf(pdf_path, max_pages=MAX_EXTRACTION_PAGES)
+
+    # Extract structured data using Claude
+    print("Extracting contract data using Claude AI...")
+    contract_data = extract_contract_data(text)
+
+    # Second pass over the whole document only if key terms were not found
+    # and the first pass left pages out
+    if missing_key_fields(contract_data) and count_pdf_pages(pdf_path) > MAX_EXTRACTION_PAGES:
+        print("Key fields missing; re-extracting from the full document...")
+        contract_data = extract_contract_data(extract_text_from_pdf(pdf_path))
+
+    return contract_data
+
+
 def process_contract(pdf_path: str, output_filename: str = None) -> None:
     """
     Main function to process a TCP contract from PDF to Excel.
@@ -290,15 +627,10 @@ def process_contract(pdf_path: str, output_filename: str = None) -> None:
     """
     print(f"Processing contract: {pdf_path}")
 
-    # Extract text from PDF
-    print("Extracting text from PDF...")
-    text = extract_text_from_pdf(pdf_path)
-
-    # Extract structured data using Claude
-    print("Extracting contract data using Claude AI...")
-    raw_contract_data = extract_contract_data(text)
+    raw_contract_data = extract_raw_contract(pdf_path)
 
     # Standardize the data
+    from src.data_standardization import standardize_and_validate
     contract_data = standardize_and_validate(raw_contract_data)
 
     # Generate output filename if not provided
@@ -313,9 +645,22 @@ def process_contract(pdf_path: str, output_filename: str = None) -> None:
     print("Processing complete!")
 
 
-def main():
+def _extract_for_batch(pdf_file: Path) -> tuple:
+    """Extract one contract for main(); returns (pdf_file, raw data or None on error)."""
+    try:
+        print(f"Processing contract: {pdf_file}")
+        return pdf_file, extract_raw_contract(str(pdf_file))
+    except Exception as e:
+        print(f"Error processing {pdf_file.name}: {str(e)}")
+        return pdf_file, None
+
+
+def main(max_workers: int = MAX_WORKERS):
     """
     Main entry point for the TCP processing agent.
+
+    Args:
+        max_workers (int): Number of contracts extracted concurrently
     """
     # Check if API key is set
     api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -337,12 +682,37 @@ def main():
 
     print(f"Found {len(pdf_files)} PDF file(s) to process.")
 
-    for pdf_file in pdf_files:
+    # Extract every contract first (in parallel: mostly waiting on the API)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pdf_files)))) as executor:
+        results = list(executor.map(_extract_for_batch, pdf_files))
+    extracted = [(pdf_file, raw) for pdf_file, raw in results if raw is not None]
+
+    if not extracted:
+        return
+
+    # Standardize each contract exactly as tcp_cli and the Streamlit app do
+    from src.data_standardization import standardize_and_validate
+
+    for pdf_file, raw_contract_data in extracted:
         try:
-            process_contract(str(pdf_file))
+            print(f"Standardizing contract: {pdf_file.name}")
+            contract_data = standardize_and_validate(raw_contract_data)
+
+            output_filename = f"{pdf_file.stem}_extracted.xlsx"
+            print(f"Exporting to Excel: {output_filename}")
+            export_to_excel(contract_data, output_filename)
         except Exception as e:
             print(f"Error processing {pdf_file.name}: {str(e)}")
 
+    print("Processing complete!")
+
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Process all TCP contract PDFs in sample_contracts/")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=f"Number of contracts to extract concurrently (default: {MAX_WORKERS})"
+    )
+    main(max_workers=parser.parse_args().workers)
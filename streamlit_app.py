@@ -6,18 +6,26 @@ Simple web interface for processing and managing TCP contracts.
 
 import streamlit as st
 import pandas as pd
-from pathlib import Path
-import tempfile
 import io
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import partial
 
 # Import from existing modules
 from src.main import (
-    extract_text_from_pdf,
+    count_pdf_pages_bytes,
+    extract_text_from_pdf_bytes,
     extract_contract_data,
-    OUTPUT_DIR
+    OUTPUT_DIR,
+    write_excel,
+    write_parquet,
+    MAX_WORKERS,
+    MAX_EXTRACTION_PAGES,
+    PARQUET_AVAILABLE,
+    missing_key_fields
 )
 from src.data_standardization import standardize_and_validate, TCPDataStandardizer
+from src.contract_index import VesselIndex
 
 
 # Page configuration
@@ -31,93 +39,225 @@ st.set_page_config(
 # Initialize session state
 if 'contracts' not in st.session_state:
     st.session_state.contracts = []
+if 'contract_index' not in st.session_state:
+    # Vessel search index, kept in step with st.session_state.contracts
+    st.session_state.contract_index = VesselIndex(st.session_state.contracts)
 
 
-def process_pdf_file(pdf_file) -> dict:
+def process_pdf_file(file_name: str, pdf_bytes: bytes) -> dict:
     """
     Process an uploaded PDF file.
 
+    Runs in worker threads, so it uses no Streamlit APIs: the bytes are read
+    from the UploadedFile on the script thread, and repeat Claude calls are
+    avoided by the on-disk extraction cache rather than st.cache_data.
+
     Args:
-        pdf_file: Streamlit UploadedFile object
+        file_name: Name of the uploaded file
+        pdf_bytes: Raw PDF file content
 
     Returns:
         Standardized contract data dictionary
     """
-    # Save uploaded file to temporary location
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-        tmp_file.write(pdf_file.read())
-        tmp_path = tmp_file.name
-
-    try:
-        # Extract text from PDF
-        text = extract_text_from_pdf(tmp_path)
+    # Extract text from the first pages of the PDF
+    text = extract_text_from_pdf_bytes(pdf_bytes, max_pages=MAX_EXTRACTION_PAGES)
 
-        # Extract structured data using Claude
-        raw_contract_data = extract_contract_data(text)
+    # Extract structured data using Claude
+    raw_contract_data = extract_contract_data(text)
 
-        # Standardize the data
-        contract_data = standardize_and_validate(raw_contract_data)
+    # Second pass over the whole document only if key terms were not found
+    # and the first pass left pages out
+    if missing_key_fields(raw_contract_data) and count_pdf_pages_bytes(pdf_bytes) > MAX_EXTRACTION_PAGES:
+        raw_contract_data = extract_contract_data(extract_text_from_pdf_bytes(pdf_bytes))
 
-        # Add metadata
-        contract_data['_source_file'] = pdf_file.name
-        contract_data['_processed_at'] = datetime.now().isoformat()
+    # Standardize the data
+    contract_data = standardize_and_validate(raw_contract_data)
 
-        return contract_data
+    # Add metadata
+    contract_data['_source_file'] = file_name
+    contract_data['_processed_at'] = datetime.now().isoformat()
 
-    finally:
-        # Clean up temporary file
-        Path(tmp_path).unlink(missing_ok=True)
+    return contract_data
 
 
-def create_excel_download(contracts: list) -> bytes:
+def create_excel_download(df: pd.DataFrame) -> bytes:
     """
-    Create Excel file from contracts list.
+    Create Excel file from a contracts table.
 
     Args:
-        contracts: List of contract dictionaries
+        df: Columnar contracts DataFrame (create_columnar_dataframe)
 
     Returns:
         Excel file as bytes
     """
-    df = TCPDataStandardizer.create_columnar_dataframe(contracts)
-
     # Create Excel file in memory
     output = io.BytesIO()
-    df.to_excel(output, index=False, engine='openpyxl', sheet_name='TCP Contracts')
+    write_excel(df, output, sheet_name='TCP Contracts')
     output.seek(0)
 
     return output.getvalue()
 
 
-def filter_contracts_by_vessel(contracts: list, vessel_name: str) -> list:
+def create_parquet_download(df: pd.DataFrame) -> bytes:
+    """
+    Create Parquet file from a contracts table.
+
+    Args:
+        df: Columnar contracts DataFrame (create_columnar_dataframe)
+
+    Returns:
+        Parquet file as bytes
+    """
+    # Create Parquet file in memory
+    output = io.BytesIO()
+    write_parquet(df, output)
+
+    return output.getvalue()
+
+
+# Detailed Contract View: (expander title, expanded, [(label, field), ...])
+CONTRACT_DETAIL_SECTIONS = [
+    ("📋 Basic Information", True, [
+        ("TCP Date", 'TCP DATE'),
+        ("Contract Type", 'CONTRACT TYPE'),
+        ("STTC/LTTC", 'STTC/ LTTC'),
+        ("Source File", '_source_file'),
+        ("Vessel Name", 'VESSEL NAME'),
+        ("IMO Number", 'IMO NUMBER'),
+        ("Type", 'TYPE AUTO.'),
+        ("Trade", 'TRADE'),
+        ("Built", 'BUILT'),
+        ("Flag", 'FLAG'),
+        ("DWT", 'DWT'),
+    ]),
+    ("🤝 Parties & Contacts", False, [
+        ("Owners", 'OWNERS.'),
+        ("Beneficial Owner", 'BENEFICIAL OWNER (FROM BANK DETAILS)'),
+        ("Owner Email", 'OWNER EMAIL ADDRESS'),
+        ("Technical Manager", 'TECHNICAL MANAGER'),
+        ("Tech Manager Email", 'TECHNICAL MANAGER EMAIL ADDRESS'),
+        ("Charterers", 'CHARTERERS'),
+        ("Broker", 'BROKER'),
+        ("Broker Email", 'BROKERS EMAIL'),
+        ("Vessel Email", 'VESSEL EMAIL'),
+    ]),
+    ("💰 Commercial Terms", False, [
+        ("Charter Length", 'CHARTER LENGTH'),
+        ("Current TC Rate (USD/day)", 'CURRENT TC RATE(CL 8)'),
+        ("Rate Type", 'FIXED/ MARKET RELATED'),
+        ("Option Periods", 'OPTION PERIODS'),
+        ("Length of Next Option", 'LENGTH OF NEXT OPTION'),
+        ("Option Declaration Date", 'OPTION DECLARATION DATE.'),
+    ]),
+    ("🚢 Delivery & Redelivery", False, [
+        ("Delivery Date", 'DELIVERY DATE'),
+        ("Redelivery Date", 'REDELIVERY DATE'),
+        ("Redelivery Location", 'REDELIVERY LOCATION'),
+        ("Earliest Redelivery Date", 'EARLIEST REDELIVERY DATE.'),
+        ("Latest Redelivery Date", 'LATEST REDELIVERY DATE.'),
+    ]),
+    ("📅 Redelivery Details", False, [
+        ("Notice Schedule", 'ALL REDEL NOTICES'),
+        ("First Notice (days)", 'FIRST REDEL NOTICE'),
+        ("Chop - Days", 'REDEL CHOP minus DAYS'),
+        ("Chop + Days", 'REDEL CHOP plus DAYS'),
+        ("Last Cargoes", 'LAST CARGOES ON REDELIVERY'),
+        ("Bunkers on Redelivery", 'BUNKERS ON REDELIVERY(CL 15)'),
+        ("Can Offhire be Added", 'CAN OFFHIRE BE ADDED?(CL 4(B))'),
+        ("Other Terms", 'OTHER REDELIVERY TERMS (E#G BALLAST BONUS)'),
+    ]),
+    ("⚓ Technical & Classification", False, [
+        ("Classification Society", 'CLASSIFICATION SOCIETY'),
+        ("P&I Club", 'P&I CLUB'),
+        ("H&M Value", 'H&M VALUE USDM'),
+        ("IMO Type", 'IMO TYPE'),
+        ("Ice Class", 'ICE CLASS'),
+        ("Drydock Location", 'DRY-DOCK LOCATION'),
+    ]),
+]
+
+
+def contract_detail_table(contract: dict, fields: list) -> pd.DataFrame:
+    """
+    Build a Field | Value table for one section of the detailed view.
+
+    Args:
+        contract: Contract dictionary
+        fields: List of (label, field name) pairs
+
+    Returns:
+        pandas DataFrame with two columns: Field and Value
+    """
+    values = []
+    for _, field in fields:
+        value = contract.get(field)
+        values.append('N/A' if value is None else str(value))
+
+    return pd.DataFrame(
+        {'Field': [label for label, _ in fields], 'Value': values}
+    ).set_index('Field')
+
+
+def contracts_cache_key(contracts: list) -> tuple:
+    """
+    Build a cheap cache key identifying a list of processed contracts.
+
+    Each contract is identified by its source file and processing timestamp,
+    which are set once when it is added.
+
+    Args:
+        contracts: List of contract dictionaries
+
+    Returns:
+        Tuple of (source file, processed-at) pairs
+    """
+    return tuple((c.get('_source_file'), c.get('_processed_at')) for c in contracts)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_columnar_dataframe(contracts_key: tuple, _contracts: list) -> pd.DataFrame:
+    """Columnar DataFrame for the contracts identified by contracts_key (not re-hashed)."""
+    return TCPDataStandardizer.create_columnar_dataframe(_contracts)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_excel_download(contracts_key: tuple, _df: pd.DataFrame) -> bytes:
+    """Excel bytes of the contracts table identified by contracts_key (not re-hashed)."""
+    return create_excel_download(_df)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_parquet_download(contracts_key: tuple, _df: pd.DataFrame) -> bytes:
+    """Parquet bytes of the contracts table identified by contracts_key (not re-hashed)."""
+    return create_parquet_download(_df)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_csv_download(contracts_key: tuple, _df: pd.DataFrame) -> str:
+    """CSV text of the contracts table identified by contracts_key (not re-hashed)."""
+    return _df.to_csv(index=False)
+
+
+def filter_contracts_by_vessel(contracts: list, vessel_name: str, index: VesselIndex = None) -> list:
     """
     Filter contracts by vessel name (case-insensitive partial match).
 
     Args:
         contracts: List of contract dictionaries
         vessel_name: Vessel name to search for
+        index: Optional VesselIndex kept in step with contracts, so the search
+            keys are not rebuilt on every search
 
     Returns:
-        Filtered list of contracts sorted by contract_date descending
+        Filtered list of contracts sorted by TCP DATE descending
     """
     if not vessel_name:
         return contracts
 
-    vessel_name_upper = vessel_name.upper()
+    if index is None:
+        index = VesselIndex(contracts)
 
-    filtered = [
-        contract for contract in contracts
-        if contract.get('VESSEL NAME') and
-        vessel_name_upper in contract['VESSEL NAME'].upper()
-    ]
-
-    # Sort by TCP DATE descending
-    filtered.sort(
-        key=lambda x: x.get('TCP DATE') or '0000-00-00',
-        reverse=True
-    )
-
-    return filtered
+    return [contracts[i] for i in index.search(vessel_name)]
 
 
 # Main UI
@@ -136,12 +276,11 @@ with st.sidebar:
     st.metric("Total Contracts", len(st.session_state.contracts))
 
     if st.session_state.contracts:
-        vessels = [c.get('vessel_name', 'N/A') for c in st.session_state.contracts]
-        unique_vessels = len(set(vessels))
-        st.metric("Unique Vessels", unique_vessels)
+        st.metric("Unique Vessels", len(st.session_state.contract_index.vessel_names))
 
     if st.button("Clear All Contracts", type="secondary"):
         st.session_state.contracts = []
+        st.session_state.contract_index.clear()
         st.rerun()
 
 # Main content area
@@ -177,25 +316,35 @@ with tab1:
             successful = 0
             failed = 0
 
-            for i, uploaded_file in enumerate(uploaded_files):
-                status_text.text(f"Processing {uploaded_file.name}...")
-
-                try:
-                    with st.spinner(f"Extracting data from {uploaded_file.name}..."):
-                        contract_data = process_pdf_file(uploaded_file)
+            # Files are processed concurrently (each is mostly waiting on the
+            # Claude API); results are reported here as they finish
+            status_text.text(f"Processing {len(uploaded_files)} file(s)...")
+            with st.spinner("Extracting contract data..."), \
+                    ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(uploaded_files))) as executor:
+                futures = {
+                    executor.submit(process_pdf_file, uploaded_file.name, uploaded_file.getvalue()): uploaded_file
+                    for uploaded_file in uploaded_files
+                }
+
+                for i, future in enumerate(as_completed(futures)):
+                    uploaded_file = futures[future]
+
+                    try:
+                        contract_data = future.result()
                         st.session_state.contracts.append(contract_data)
+                        st.session_state.contract_index.add(contract_data)
                         successful += 1
 
                         st.success(
                             f"✓ {uploaded_file.name} - "
-                            f"Vessel: {contract_data.get('vessel_name', 'N/A')}"
+                            f"Vessel: {contract_data.get('VESSEL NAME') or 'N/A'}"
                         )
 
-                except Exception as e:
-                    failed += 1
-                    st.error(f"✗ {uploaded_file.name} - Error: {str(e)}")
+                    except Exception as e:
+                        failed += 1
+                        st.error(f"✗ {uploaded_file.name} - Error: {str(e)}")
 
-                progress_bar.progress((i + 1) / len(uploaded_files))
+                    progress_bar.progress((i + 1) / len(uploaded_files))
 
             status_text.text("Processing complete!")
 
@@ -232,14 +381,17 @@ with tab2:
         # Filter contracts
         filtered_contracts = filter_contracts_by_vessel(
             st.session_state.contracts,
-            search_query
+            search_query,
+            st.session_state.contract_index
         )
 
         st.markdown(f"**Showing {len(filtered_contracts)} contract(s)**")
 
         if filtered_contracts:
-            # Create DataFrame
-            df = TCPDataStandardizer.create_columnar_dataframe(filtered_contracts)
+            # Create DataFrame (rebuilt only when the filtered contracts change);
+            # the table, Excel, CSV and Parquet downloads all use this one frame
+            filtered_key = contracts_cache_key(filtered_contracts)
+            df = _cached_columnar_dataframe(filtered_key, filtered_contracts)
 
             # Select columns to display
             if show_all:
@@ -266,17 +418,18 @@ with tab2:
             st.markdown("---")
             st.subheader("Export Data")
 
+            # Export files are built only when their button is clicked (the
+            # callables run then) and are cached per filtered contract set
             col1, col2, col3 = st.columns([2, 2, 2])
 
             with col1:
                 # Excel download
-                excel_data = create_excel_download(filtered_contracts)
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"tcp_contracts_{timestamp}.xlsx"
 
                 st.download_button(
                     label="📥 Download as Excel",
-                    data=excel_data,
+                    data=partial(_cached_excel_download, filtered_key, df),
                     file_name=filename,
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                     use_container_width=True
@@ -284,16 +437,25 @@ with tab2:
 
             with col2:
                 # CSV download
-                csv_data = df.to_csv(index=False)
-
                 st.download_button(
                     label="📥 Download as CSV",
-                    data=csv_data,
+                    data=partial(_cached_csv_download, filtered_key, df),
                     file_name=f"tcp_contracts_{timestamp}.csv",
                     mime="text/csv",
                     use_container_width=True
                 )
 
+            with col3:
+                # Parquet download (compact, fast to write; needs pyarrow)
+                if PARQUET_AVAILABLE:
+                    st.download_button(
+                        label="📥 Download as Parquet",
+                        data=partial(_cached_parquet_download, filtered_key, df),
+                        file_name=f"tcp_contracts_{timestamp}.parquet",
+                        mime="application/vnd.apache.parquet",
+                        use_container_width=True
+                    )
+
             # Detailed view
             st.markdown("---")
             st.subheader("Detailed Contract View")
@@ -314,94 +476,10 @@ with tab2:
                 selected_contract = filtered_contracts[selected_idx]
 
                 # Display in expandable sections - Updated for 53-field structure
-                with st.expander("📋 Basic Information", expanded=True):
-                    col1, col2 = st.columns(2)
-
-                    with col1:
-                        st.write("**Contract Details**")
-                        st.write(f"TCP Date: {selected_contract.get('TCP DATE', 'N/A')}")
-                        st.write(f"Contract Type: {selected_contract.get('CONTRACT TYPE', 'N/A')}")
-                        st.write(f"STTC/LTTC: {selected_contract.get('STTC/ LTTC', 'N/A')}")
-                        st.write(f"Source File: {selected_contract.get('_source_file', 'N/A')}")
-
-                    with col2:
-                        st.write("**Vessel Information**")
-                        st.write(f"Vessel Name: {selected_contract.get('VESSEL NAME', 'N/A')}")
-                        st.write(f"IMO Number: {selected_contract.get('IMO NUMBER', 'N/A')}")
-                        st.write(f"Type: {selected_contract.get('TYPE AUTO.', 'N/A')}")
-                        st.write(f"Trade: {selected_contract.get('TRADE', 'N/A')}")
-                        st.write(f"Built: {selected_contract.get('BUILT', 'N/A')}")
-                        st.write(f"Flag: {selected_contract.get('FLAG', 'N/A')}")
-                        st.write(f"DWT: {selected_contract.get('DWT', 'N/A')}")
-
-                with st.expander("🤝 Parties & Contacts"):
-                    col1, col2 = st.columns(2)
-
-                    with col1:
-                        st.write("**Owners**")
-                        st.write(f"Name: {selected_contract.get('OWNERS.', 'N/A')}")
-                        st.write(f"Beneficial Owner: {selected_contract.get('BENEFICIAL OWNER (FROM BANK DETAILS)', 'N/A')}")
-                        st.write(f"Email: {selected_contract.get('OWNER EMAIL ADDRESS', 'N/A')}")
-                        st.write(f"Technical Manager: {selected_contract.get('TECHNICAL MANAGER', 'N/A')}")
-                        st.write(f"Tech Manager Email: {selected_contract.get('TECHNICAL MANAGER EMAIL ADDRESS', 'N/A')}")
-
-                    with col2:
-                        st.write("**Charterers**")
-                        st.write(f"Name: {selected_contract.get('CHARTERERS', 'N/A')}")
-                        st.write("")
-                        st.write("**Other Contacts**")
-                        st.write(f"Broker: {selected_contract.get('BROKER', 'N/A')}")
-                        st.write(f"Broker Email: {selected_contract.get('BROKERS EMAIL', 'N/A')}")
-                        st.write(f"Vessel Email: {selected_contract.get('VESSEL EMAIL', 'N/A')}")
-
-                with st.expander("💰 Commercial Terms"):
-                    col1, col2 = st.columns(2)
-
-                    with col1:
-                        st.write(f"**Charter Length:** {selected_contract.get('CHARTER LENGTH', 'N/A')}")
-                        st.write(f"**Current TC Rate:** ${selected_contract.get('CURRENT TC RATE(CL 8)', 'N/A')}")
-                        st.write(f"**Rate Type:** {selected_contract.get('FIXED/ MARKET RELATED', 'N/A')}")
-
-                    with col2:
-                        st.write(f"**Option Periods:** {selected_contract.get('OPTION PERIODS', 'N/A')}")
-                        st.write(f"**Length of Next Option:** {selected_contract.get('LENGTH OF NEXT OPTION', 'N/A')}")
-                        st.write(f"**Option Declaration Date:** {selected_contract.get('OPTION DECLARATION DATE.', 'N/A')}")
-
-                with st.expander("🚢 Delivery & Redelivery"):
-                    col1, col2 = st.columns(2)
-
-                    with col1:
-                        st.write("**Delivery**")
-                        st.write(f"Date: {selected_contract.get('DELIVERY DATE', 'N/A')}")
-
-                    with col2:
-                        st.write("**Redelivery**")
-                        st.write(f"Date: {selected_contract.get('REDELIVERY DATE', 'N/A')}")
-                        st.write(f"Location: {selected_contract.get('REDELIVERY LOCATION', 'N/A')}")
-                        st.write(f"Earliest Date: {selected_contract.get('EARLIEST REDELIVERY DATE.', 'N/A')}")
-                        st.write(f"Latest Date: {selected_contract.get('LATEST REDELIVERY DATE.', 'N/A')}")
-
-                with st.expander("📅 Redelivery Details"):
-                    st.write(f"**Notice Schedule:** {selected_contract.get('ALL REDEL NOTICES', 'N/A')}")
-                    st.write(f"**First Notice (days):** {selected_contract.get('FIRST REDEL NOTICE', 'N/A')}")
-                    st.write(f"**Chop -/+ Days:** {selected_contract.get('REDEL CHOP minus DAYS', 'N/A')} / {selected_contract.get('REDEL CHOP plus DAYS', 'N/A')}")
-                    st.write(f"**Last Cargoes:** {selected_contract.get('LAST CARGOES ON REDELIVERY', 'N/A')}")
-                    st.write(f"**Bunkers on Redelivery:** {selected_contract.get('BUNKERS ON REDELIVERY(CL 15)', 'N/A')}")
-                    st.write(f"**Can Offhire be Added:** {selected_contract.get('CAN OFFHIRE BE ADDED?(CL 4(B))', 'N/A')}")
-                    st.write(f"**Other Terms:** {selected_contract.get('OTHER REDELIVERY TERMS (E#G BALLAST BONUS)', 'N/A')}")
-
-                with st.expander("⚓ Technical & Classification"):
-                    col1, col2 = st.columns(2)
-
-                    with col1:
-                        st.write(f"**Classification Society:** {selected_contract.get('CLASSIFICATION SOCIETY', 'N/A')}")
-                        st.write(f"**P&I Club:** {selected_contract.get('P&I CLUB', 'N/A')}")
-                        st.write(f"**H&M Value:** {selected_contract.get('H&M VALUE USDM', 'N/A')}")
-
-                    with col2:
-                        st.write(f"**IMO Type:** {selected_contract.get('IMO TYPE', 'N/A')}")
-                        st.write(f"**Ice Class:** {selected_contract.get('ICE CLASS', 'N/A')}")
-                        st.write(f"**Drydock Location:** {selected_contract.get('DRY-DOCK LOCATION', 'N/A')}")
+                # (one table per section rather than one element per field)
+                for title, expanded, fields in CONTRACT_DETAIL_SECTIONS:
+                    with st.expander(title, expanded=expanded):
+                        st.table(contract_detail_table(selected_contract, fields))
 
         else:
             st.warning(f"No contracts found matching '{search_query}'")
@@ -10,6 +10,8 @@ Command-line interface for processing TCP contracts with the following features:
 
 import argparse
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional
 import pandas as pd
@@ -17,13 +19,20 @@ from datetime import datetime
 
 # Import from existing modules
 from src.main import (
+    count_pdf_pages,
     extract_text_from_pdf,
     extract_contract_data,
     export_to_excel,
     OUTPUT_DIR,
-    CONTRACTS_DIR
+    CONTRACTS_DIR,
+    MAX_WORKERS,
+    MAX_EXTRACTION_PAGES,
+    missing_key_fields,
+    write_excel,
+    write_parquet
 )
 from src.data_standardization import standardize_and_validate, TCPDataStandardizer
+from src.contract_index import VesselIndex
 
 
 class TCPDatabase:
@@ -31,34 +40,31 @@ class TCPDatabase:
 
     def __init__(self):
         self.contracts = []
+        # Vessel search keys, kept in step with self.contracts
+        self._index = VesselIndex()
+        # Contracts may be added from several worker threads (process_all_tcps)
+        self._lock = threading.Lock()
 
     def add_contract(self, contract_data: dict, filename: str):
         """Add a processed contract to the database."""
         contract_data['_source_file'] = filename
         contract_data['_processed_at'] = datetime.now().isoformat()
-        self.contracts.append(contract_data)
+        with self._lock:
+            self.contracts.append(contract_data)
+            self._index.add(contract_data)
 
     def query_by_vessel_name(self, vessel_name: str) -> List[dict]:
         """
         Query contracts by vessel name (case-insensitive partial match).
-        Returns list of contracts ordered by contract_date descending.
+        Returns list of contracts ordered by TCP DATE descending.
         """
-        vessel_name_upper = vessel_name.upper()
+        # Vectorized match on VESSEL NAME, sorted by TCP DATE (most recent first)
+        return [self.contracts[i] for i in self._index.search(vessel_name)]
 
-        # Filter contracts that match the vessel name
-        matching = [
-            contract for contract in self.contracts
-            if contract.get('vessel_name') and
-            vessel_name_upper in contract['vessel_name'].upper()
-        ]
-
-        # Sort by contract_date descending (most recent first)
-        matching.sort(
-            key=lambda x: x.get('contract_date') or '0000-00-00',
-            reverse=True
-        )
-
-        return matching
+    @property
+    def unique_vessels(self) -> set:
+        """Distinct vessel names in the database (maintained on insert)."""
+        return self._index.vessel_names
 
     def get_all_contracts(self) -> List[dict]:
         """Get all contracts in the database."""
@@ -67,18 +73,21 @@ class TCPDatabase:
     def clear(self):
         """Clear all contracts from database."""
         self.contracts = []
+        self._index.clear()
 
 
 # Global database instance
 db = TCPDatabase()
 
 
-def process_single_tcp(filename: str) -> Optional[dict]:
+def process_single_tcp(filename: str, text: Optional[str] = None) -> Optional[dict]:
     """
     Process a single TCP contract file.
 
     Args:
         filename: Name of the PDF file (with or without .pdf extension)
+        text: Text already extracted from the first MAX_EXTRACTION_PAGES pages
+            of the PDF (skips step 1)
 
     Returns:
         Standardized contract data or None if processing fails
@@ -99,13 +108,21 @@ def process_single_tcp(filename: str) -> Optional[dict]:
     try:
         # Extract text from PDF
         print("Step 1/3: Extracting text from PDF...")
-        text = extract_text_from_pdf(str(pdf_path))
+        # (first pages only; the full document is read only if key fields are missing)
+        if text is None:
+            text = extract_text_from_pdf(str(pdf_path), max_pages=MAX_EXTRACTION_PAGES)
         print(f"  - Extracted {len(text)} characters")
 
         # Extract structured data using Claude
         print("Step 2/3: Extracting contract data using Claude AI...")
         raw_contract_data = extract_contract_data(text)
 
+        # Second pass over the whole document only if key terms were not found
+        # and the first pass left pages out
+        if missing_key_fields(raw_contract_data) and count_pdf_pages(str(pdf_path)) > MAX_EXTRACTION_PAGES:
+            print("  - Key fields missing; re-extracting from the full document...")
+            raw_contract_data = extract_contract_data(extract_text_from_pdf(str(pdf_path)))
+
         # Standardize the data
         print("Step 3/3: Standardizing data...")
         contract_data = standardize_and_validate(raw_contract_data)
@@ -114,8 +131,8 @@ def process_single_tcp(filename: str) -> Optional[dict]:
         db.add_contract(contract_data, filename)
 
         print(f"\n✓ Successfully processed: {filename}")
-        print(f"  Vessel: {contract_data.get('vessel_name', 'N/A')}")
-        print(f"  Contract Date: {contract_data.get('contract_date', 'N/A')}")
+        print(f"  Vessel: {contract_data.get('VESSEL NAME') or 'N/A'}")
+        print(f"  Contract Date: {contract_data.get('TCP DATE') or 'N/A'}")
 
         return contract_data
 
@@ -124,10 +141,18 @@ def process_single_tcp(filename: str) -> Optional[dict]:
         return None
 
 
-def process_all_tcps() -> List[dict]:
+def process_all_tcps(max_workers: int = MAX_WORKERS, jobs: int = 1) -> List[dict]:
     """
     Process all TCP PDF files in the contracts directory.
 
+    Files are processed concurrently (each one mostly waits on the Claude API),
+    so their progress output may interleave.
+
+    Args:
+        max_workers: Number of contracts processed at the same time
+        jobs: Number of processes used to extract PDF text up front (1 extracts
+            text inside each worker thread instead)
+
     Returns:
         List of successfully processed contract data
     """
@@ -143,15 +168,34 @@ def process_all_tcps() -> List[dict]:
     successful = []
     failed = []
 
-    for i, pdf_file in enumerate(pdf_files, 1):
-        print(f"\n[{i}/{len(pdf_files)}] Processing: {pdf_file.name}")
-
-        contract_data = process_single_tcp(pdf_file.name)
-
-        if contract_data:
-            successful.append(contract_data)
-        else:
-            failed.append(pdf_file.name)
+    # PDF parsing is CPU-bound: with jobs > 1 all text is extracted first in
+    # separate processes; files that fail here are retried in process_single_tcp
+    texts = {}
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pdf_files))) as executor:
+            text_futures = {
+                pdf_file: executor.submit(extract_text_from_pdf, str(pdf_file), False, MAX_EXTRACTION_PAGES)
+                for pdf_file in pdf_files
+            }
+        for pdf_file, text_future in text_futures.items():
+            if text_future.exception() is None:
+                texts[pdf_file] = text_future.result()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pdf_files)))) as executor:
+        futures = {
+            executor.submit(process_single_tcp, pdf_file.name, texts.get(pdf_file)): pdf_file
+            for pdf_file in pdf_files
+        }
+
+        for i, future in enumerate(as_completed(futures), 1):
+            pdf_file = futures[future]
+            contract_data = future.result()
+            print(f"\n[{i}/{len(pdf_files)}] Finished: {pdf_file.name}")
+
+            if contract_data:
+                successful.append(contract_data)
+            else:
+                failed.append(pdf_file.name)
 
     print("\n" + "=" * 60)
     print(f"Processing complete!")
@@ -189,57 +233,68 @@ def query_vessel(vessel_name: str):
     print(f"Found {len(results)} contract(s):\n")
 
     for i, contract in enumerate(results, 1):
-        print(f"{i}. Vessel Name: {contract.get('vessel_name', 'N/A')}")
-        print(f"   Contract Date: {contract.get('contract_date', 'N/A')}")
+        print(f"{i}. Vessel Name: {contract.get('VESSEL NAME') or 'N/A'}")
+        print(f"   Contract Date: {contract.get('TCP DATE') or 'N/A'}")
         print(f"   Created At: {contract.get('_processed_at', 'N/A')}")
         print(f"   Source File: {contract.get('_source_file', 'N/A')}")
-        print(f"   Charter Period: {contract.get('charter_period_months', 'N/A')} months")
-        print(f"   Daily Hire Rate: ${contract.get('daily_hire_rate_usd', 'N/A')}")
+        print(f"   Charter Length: {contract.get('CHARTER LENGTH') or 'N/A'}")
+        print(f"   Current TC Rate: {contract.get('CURRENT TC RATE(CL 8)') or 'N/A'}")
         print()
 
 
-def export_to_excel_file(output_filename: str = None):
+# Export format -> file extension
+EXPORT_FORMATS = {'xlsx': '.xlsx', 'csv': '.csv', 'parquet': '.parquet'}
+
+
+def export_contracts(output_filename: str = None, export_format: str = 'xlsx'):
     """
-    Export all processed contracts to Excel file.
+    Export all processed contracts to an Excel, CSV or Parquet file.
 
     Args:
         output_filename: Optional custom output filename
+        export_format: 'xlsx' (default), 'csv' or 'parquet' (fastest and
+            smallest for large batches; requires pyarrow)
     """
     if not db.contracts:
         print("\nNo contracts to export. Please process contracts first.")
         return
 
+    if export_format not in EXPORT_FORMATS:
+        print(f"\nUnsupported export format: {export_format}")
+        return
+
+    suffix = EXPORT_FORMATS[export_format]
+
     # Generate filename if not provided
     if output_filename is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_filename = f"tcp_contracts_export_{timestamp}.xlsx"
+        output_filename = f"tcp_contracts_export_{timestamp}{suffix}"
 
-    # Add .xlsx extension if not present
-    if not output_filename.endswith('.xlsx'):
-        output_filename = f"{output_filename}.xlsx"
+    # Add extension if not present
+    if not output_filename.endswith(suffix):
+        output_filename = f"{output_filename}{suffix}"
 
     output_path = OUTPUT_DIR / output_filename
 
-    print(f"\nExporting {len(db.contracts)} contract(s) to Excel...")
+    print(f"\nExporting {len(db.contracts)} contract(s) to {export_format.upper()}...")
 
     try:
         # Create a columnar DataFrame (each contract is a row)
         df = TCPDataStandardizer.create_columnar_dataframe(db.contracts)
 
-        # Export to Excel
-        df.to_excel(
-            output_path,
-            index=False,
-            engine='openpyxl',
-            sheet_name='TCP Contracts'
-        )
+        if export_format == 'csv':
+            df.to_csv(output_path, index=False)
+        elif export_format == 'parquet':
+            write_parquet(df, output_path)
+        else:
+            write_excel(df, output_path, sheet_name='TCP Contracts')
 
         print(f"✓ Successfully exported to: {output_path}")
         print(f"  Total contracts: {len(db.contracts)}")
         print(f"  Total columns: {len(df.columns)}")
 
     except Exception as e:
-        print(f"✗ Error exporting to Excel: {str(e)}")
+        print(f"✗ Error exporting to {export_format.upper()}: {str(e)}")
 
 
 def interactive_menu():
@@ -253,7 +308,7 @@ def interactive_menu():
         print("  1. Process a single TCP by filename")
         print("  2. Process all TCPs in folder")
         print("  3. Query for a specific vessel name")
-        print("  4. Export results to Excel")
+        print("  4. Export results (Excel, CSV or Parquet)")
         print("  5. Show database statistics")
         print("  6. Clear database")
         print("  0. Exit")
@@ -281,15 +336,15 @@ def interactive_menu():
 
         elif choice == '4':
             filename = input("\nEnter output filename (or press Enter for auto-generated): ").strip()
-            export_to_excel_file(filename if filename else None)
+            export_format = input("Enter format - xlsx, csv or parquet (or press Enter for xlsx): ").strip().lower()
+            export_contracts(filename if filename else None, export_format or 'xlsx')
 
         elif choice == '5':
             print(f"\nDatabase Statistics:")
             print(f"  Total contracts: {len(db.contracts)}")
             if db.contracts:
-                vessels = [c.get('vessel_name', 'N/A') for c in db.contracts]
-                print(f"  Unique vessels: {len(set(vessels))}")
-                print(f"  Vessels: {', '.join(set(vessels))}")
+                print(f"  Unique vessels: {len(db.unique_vessels)}")
+                print(f"  Vessels: {', '.join(sorted(db.unique_vessels))}")
 
         elif choice == '6':
             confirm = input("\nAre you sure you want to clear the database? (y/n): ").strip().lower()
@@ -326,6 +381,9 @@ Examples:
 
   # Process all and export to Excel
   python tcp_cli.py --process-all --export contracts.xlsx
+
+  # Process all and export to Parquet
+  python tcp_cli.py --process-all --export contracts --export-format parquet
         """
     )
 
@@ -352,7 +410,30 @@ Examples:
         metavar='OUTPUT_FILE',
         nargs='?',
         const='auto',
-        help='Export results to Excel (optional: specify filename)'
+        help='Export results (optional: specify filename; format set by --export-format)'
+    )
+
+    parser.add_argument(
+        '--export-format',
+        choices=sorted(EXPORT_FORMATS),
+        default='xlsx',
+        help='File format for --export (default: xlsx; parquet is fastest for large batches)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=MAX_WORKERS,
+        metavar='N',
+        help=f'Number of contracts processed concurrently by --process-all (default: {MAX_WORKERS})'
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of processes extracting PDF text for --process-all (default: 1)'
     )
 
     parser.add_argument(
@@ -382,7 +463,7 @@ Examples:
 
     # Process all files
     if args.process_all:
-        process_all_tcps()
+        process_all_tcps(args.workers, args.jobs)
 
     # Query vessel
     if args.query:
@@ -392,12 +473,12 @@ Examples:
         else:
             query_vessel(args.query)
 
-    # Export to Excel
+    # Export results
     if args.export:
         if args.export == 'auto':
-            export_to_excel_file()
+            export_contracts(export_format=args.export_format)
         else:
-            export_to_excel_file(args.export)
+            export_contracts(args.export, args.export_format)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,150 @@
+"""
+Test the vessel-name search index
+
+Run with pytest:
+    pytest test_contract_index.py
+"""
+
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from contract_index import VesselIndex
+
+
+def _contract(vessel_name, tcp_date=None):
+    return {"VESSEL NAME": vessel_name, "TCP DATE": tcp_date}
+
+
+CONTRACTS = [
+    _contract("NORTHERN STAR", "2024-01-15"),
+    _contract("PACIFIC DAWN", "2023-06-01"),
+    _contract("BANANA STAR", "2022-03-10"),
+    _contract("AEGEAN EXPRESS", "2021-09-30"),
+]
+
+
+@pytest.fixture
+def index():
+    return VesselIndex(CONTRACTS)
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("S", [0, 2, 3]),            # Single character: substring match over all names
+    ("ST", [0, 2]),              # Two characters: below the trigram length
+    ("AN", [2, 3]),
+])
+def test_short_queries(index, query, expected):
+    """Queries under 3 characters fall back to a substring match."""
+    assert index.search(query) == expected
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("ANANA", [2]),              # Trigram ANA appears twice in the query
+    ("NANAN", []),               # Every trigram is in BANANA, but not the substring
+    ("STAR STAR", []),           # Repeated trigrams, not in any name
+])
+def test_repeated_trigrams(index, query, expected):
+    """Matches are confirmed on the name, not just the shared trigrams."""
+    assert index.search(query) == expected
+
+
+@pytest.mark.parametrize("query", [
+    "northern star",
+    "Northern Star",
+    "  northern   star  ",
+    "NORTHERN\tSTAR",
+])
+def test_query_normalization(index, query):
+    """Queries ignore case and extra whitespace."""
+    assert index.search(query) == [0]
+
+
+def test_name_normalization():
+    """Stored names are upper-cased with their whitespace collapsed."""
+    index = VesselIndex([_contract("  northern   star ", "2024-01-15")])
+
+    assert index.vessel_names == {"NORTHERN STAR"}
+    assert index.search("NORTHERN STAR") == [0]
+
+
+@pytest.mark.parametrize("query", ["ATLANTIC", "XY", "Z"])
+def test_no_match(index, query):
+    """A query matching no name returns no positions."""
+    assert index.search(query) == []
+
+
+def test_empty_index():
+    assert VesselIndex().search("STAR") == []
+
+
+def test_clear(index):
+    """clear() forgets every contract, name, trigram and cached array."""
+    index.search("STAR")   # Build the cached arrays
+    index.search("ST")
+    index.clear()
+
+    assert len(index) == 0
+    assert index.vessel_names == set()
+    assert index._names == [] and index._dates == []
+    assert not index._trigram_positions
+    assert index._names_series is None and index._dates_array is None
+    assert index.search("STAR") == []
+
+    index.add(_contract("PACIFIC DAWN", "2023-06-01"))
+    assert index.search("PACIFIC") == [0]
+    assert index.search("STAR") == []
+
+
+
+def test_search_sorts_by_date_descending(index):
+    assert index.search("A") == [0, 1, 2, 3]
+    assert VesselIndex(CONTRACTS[::-1]).search("A") == [3, 2, 1, 0]
+
+
+def test_search_date_ties_keep_list_order():
+    """Contracts with the same TCP DATE stay in the order they were added."""
+    index = VesselIndex([
+        _contract("STAR ONE", "2023-01-01"),
+        _contract("STAR TWO", "2024-01-01"),
+        _contract("STAR THREE", "2023-01-01"),
+        _contract("STAR FOUR", "2024-01-01"),
+        _contract("STAR FIVE", "2023-01-01"),
+    ])
+
+    assert index.search("STAR") == [1, 3, 0, 2, 4]
+    assert index.search("ST") == [1, 3, 0, 2, 4]
+
+
+def test_search_undated_contracts_sort_last():
+    """Contracts without a TCP DATE come after every dated one, in list order."""
+    index = VesselIndex([
+        _contract("STAR ONE"),
+        _contract("STAR TWO", "2020-01-01"),
+        _contract("STAR THREE", ""),
+        _contract("STAR FOUR", "2024-01-01"),
+    ])
+
+    assert index.search("STAR") == [3, 1, 0, 2]
+
+
+def test_search_mixed_date_types():
+    """date/datetime and ISO string TCP DATEs sort together."""
+    index = VesselIndex([
+        _contract("STAR ONE", date(2023, 1, 1)),
+        _contract("STAR TWO", "2024-01-01"),
+        _contract("STAR THREE", datetime(2025, 1, 1, 12, 0)),
+        _contract("STAR FOUR"),
+        _contract("STAR FIVE", "2022-06-30"),
+    ])
+
+    assert index.search("STAR") == [2, 1, 0, 4, 3]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,122 @@
+"""
+Test the extraction result cache (offline: the Claude client is faked)
+
+Run with pytest:
+    pytest test_extraction_cache.py
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src import main
+
+
+CONTRACT_TEXT = "TIME CHARTER PARTY\nVessel: M/V NORTHERN STAR\nDate: January 15, 2024"
+
+
+class FakeMessages:
+    """Stands in for client.messages, replying with a fixed tool call."""
+
+    def __init__(self):
+        self.calls = 0
+        self.vessel_name = "NORTHERN STAR"
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(
+            usage=SimpleNamespace(input_tokens=100, output_tokens=50),
+            stop_reason="tool_use",
+            content=[SimpleNamespace(type="tool_use", input={"VESSEL NAME": self.vessel_name})],
+        )
+
+
+@pytest.fixture
+def fake_messages(monkeypatch, tmp_path):
+    """Cache in tmp_path and a fake client; returns the fake's messages."""
+    messages = FakeMessages()
+    monkeypatch.setattr(main, "EXTRACTION_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(main, "_get_client", lambda: SimpleNamespace(messages=messages))
+    monkeypatch.delenv("EXTRACTION_CACHE_MODE", raising=False)
+    return messages
+
+
+def test_cache_hit_skips_api(fake_messages, tmp_path):
+    first = main.extract_contract_data(CONTRACT_TEXT)
+    second = main.extract_contract_data(CONTRACT_TEXT)
+
+    assert first == second == {"VESSEL NAME": "NORTHERN STAR"}
+    assert fake_messages.calls == 1
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_different_text_misses_cache(fake_messages):
+    main.extract_contract_data(CONTRACT_TEXT)
+    main.extract_contract_data(CONTRACT_TEXT + "\nAddendum No. 1")
+
+    assert fake_messages.calls == 2
+
+
+def test_use_cache_false_skips_cache(fake_messages, tmp_path):
+    main.extract_contract_data(CONTRACT_TEXT, use_cache=False)
+
+    assert fake_messages.calls == 1
+    assert not list(tmp_path.glob("*.json"))
+
+
+@pytest.mark.parametrize("mode", ["refresh", "write_only"])
+def test_refresh_overwrites_entry(fake_messages, monkeypatch, mode):
+    main.extract_contract_data(CONTRACT_TEXT)
+
+    fake_messages.vessel_name = "PACIFIC DAWN"
+    monkeypatch.setenv("EXTRACTION_CACHE_MODE", mode)
+    assert main.extract_contract_data(CONTRACT_TEXT) == {"VESSEL NAME": "PACIFIC DAWN"}
+    assert fake_messages.calls == 2
+
+    # The overwritten entry is served from then on
+    monkeypatch.setenv("EXTRACTION_CACHE_MODE", "on")
+    assert main.extract_contract_data(CONTRACT_TEXT) == {"VESSEL NAME": "PACIFIC DAWN"}
+    assert fake_messages.calls == 2
+
+
+def test_read_only_does_not_write(fake_messages, monkeypatch, tmp_path):
+    monkeypatch.setenv("EXTRACTION_CACHE_MODE", "read_only")
+    main.extract_contract_data(CONTRACT_TEXT)
+
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_off_ignores_cache(fake_messages, monkeypatch):
+    main.extract_contract_data(CONTRACT_TEXT)
+
+    monkeypatch.setenv("EXTRACTION_CACHE_MODE", "off")
+    main.extract_contract_data(CONTRACT_TEXT)
+
+    assert fake_messages.calls == 2
+
+
+def test_unreadable_entry_is_a_miss(fake_messages, tmp_path):
+    main.extract_contract_data(CONTRACT_TEXT)
+    for entry in tmp_path.glob("*.json"):
+        entry.write_text("{not json", encoding="utf-8")
+
+    assert main.extract_contract_data(CONTRACT_TEXT) == {"VESSEL NAME": "NORTHERN STAR"}
+    assert fake_messages.calls == 2
+
+
+@pytest.mark.parametrize("mode", ["sometimes", "read-only", ""])
+def test_invalid_mode_raises(fake_messages, monkeypatch, mode):
+    monkeypatch.setenv("EXTRACTION_CACHE_MODE", mode)
+
+    with pytest.raises(ValueError, match="Invalid EXTRACTION_CACHE_MODE"):
+        main.extract_contract_data(CONTRACT_TEXT)
+    assert fake_messages.calls == 0
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -11,7 +11,7 @@ from pathlib import Path
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from main import extract_text_from_pdf, extract_contract_data, export_to_excel, OUTPUT_DIR
+from main import extract_text_from_pdf, extract_contract_data, export_to_excel, OUTPUT_DIR, count_words
 
 def test_pipeline():
     """Test the complete pipeline with one sample contract."""
@@ -34,7 +34,7 @@ def test_pipeline():
         print("\n[STEP 1] Extracting text from PDF...")
         text = extract_text_from_pdf(str(pdf_file))
         print(f"  - Extracted {len(text):,} characters")
-        print(f"  - {len(text.split()):,} words")
+        print(f"  - {count_words(text):,} words")
 
         # Step 2: Extract structured data with Claude AI
         print("\n[STEP 2] Extracting structured data with Claude AI...")
@@ -8,7 +8,7 @@ from pathlib import Path
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from main import extract_text_from_pdf, extract_contract_data
+from main import extract_text_from_pdf, extract_contract_data, count_words
 
 def test_extraction_with_cost():
     """Test extraction with cost tracking."""
@@ -25,7 +25,7 @@ def test_extraction_with_cost():
         # Step 1: Extract text
         print("\n[STEP 1] Extracting text from PDF...")
         text = extract_text_from_pdf(str(pdf_file))
-        print(f"  - Extracted {len(text):,} characters ({len(text.split()):,} words)")
+        print(f"  - Extracted {len(text):,} characters ({count_words(text):,} words)")
 
         # Step 2: Extract data with Claude (includes cost tracking)
         print("\n[STEP 2] Extracting structured data with Claude AI...")
@@ -2,9 +2,14 @@
 Verify the Excel output format and demonstrate CSV conversion
 """
 
-import pandas as pd
+import csv
+from collections import deque
+from itertools import islice
 from pathlib import Path
 
+import openpyxl
+import pandas as pd
+
 def verify_and_convert():
     """Verify Excel format and convert to CSV."""
 
@@ -18,29 +23,46 @@ def verify_and_convert():
     print("EXCEL FILE VERIFICATION AND CSV CONVERSION")
     print("="*80)
 
-    # Read Excel file
+    # Stream the sheet straight into the CSV file, keeping only the rows
+    # displayed below in memory
     print(f"\nReading: {excel_file}")
-    df = pd.read_excel(excel_file)
+    csv_file = Path("output/tcp_contract_001_extracted.csv")
+    first_rows = []
+    last_rows = deque(maxlen=5)
+    row_count = 0
+
+    workbook = openpyxl.load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        columns = list(next(rows, ()))
+
+        with open(csv_file, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for row in rows:
+                writer.writerow(row)
+                if row_count < 10:
+                    first_rows.append(row)
+                last_rows.append(row)
+                row_count += 1
+    finally:
+        workbook.close()
 
     # Display structure
     print(f"\n[Excel Structure]")
-    print(f"  - Rows: {len(df)}")
-    print(f"  - Columns: {len(df.columns)}")
-    print(f"  - Column names: {list(df.columns)}")
+    print(f"  - Rows: {row_count}")
+    print(f"  - Columns: {len(columns)}")
+    print(f"  - Column names: {columns}")
 
     # Display first 10 rows
     print(f"\n[First 10 Rows]")
     print("-"*80)
-    print(df.head(10).to_string(index=False))
+    print(pd.DataFrame(first_rows, columns=columns).to_string(index=False))
 
     # Display last 5 rows
     print(f"\n[Last 5 Rows]")
     print("-"*80)
-    print(df.tail(5).to_string(index=False))
-
-    # Convert to CSV
-    csv_file = Path("output/tcp_contract_001_extracted.csv")
-    df.to_csv(csv_file, index=False)
+    print(pd.DataFrame(list(last_rows), columns=columns).to_string(index=False))
 
     print(f"\n[CSV Conversion]")
     print(f"  - CSV file created: {csv_file}")
@@ -50,8 +72,7 @@ def verify_and_convert():
     print(f"\n[CSV File Preview]")
     print("-"*80)
     with open(csv_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()[:15]
-        for line in lines:
+        for line in islice(f, 15):
             print(line.rstrip())
 
     print("\n" + "="*80)